@@ -16,7 +16,7 @@ from __future__ import annotations
 
 from importlib.metadata import version as dist_version  # py3.11+
 import argparse
-import html
+import functools
 import re
 import sys
 import xml.etree.ElementTree as ET
@@ -31,6 +31,10 @@ except Exception:  # pragma: no cover
     raise
 
 
+_PY_CLASSIFIER_RE = re.compile(r"Programming Language :: Python :: (\d\.\d+)")
+
+
+@functools.cache
 def read_pyproject() -> dict:
     pp = Path("pyproject.toml")
     if not pp.exists():
@@ -81,7 +85,7 @@ def extract_python_versions(project: dict) -> str:
     classifiers: Iterable[str] = project.get("classifiers", []) or []
     py_vers = []
     for c in classifiers:
-        m = re.fullmatch(r"Programming Language :: Python :: (\d\.\d+)", c)
+        m = _PY_CLASSIFIER_RE.fullmatch(c)
         if m:
             py_vers.append(m.group(1))
 
@@ -108,24 +112,49 @@ def find_coverage() -> Optional[str]:
         return None
 
     try:
-        root = ET.parse(cov).getroot()
-        # Cobertura root has attributes like line-rate="0.87"
-        lr = root.attrib.get("line-rate")
-        if lr is not None:
-            pct = round(float(lr) * 100)
-            return f"{pct}%"
+        # Only the root element is needed, so stop at its first start event
+        # instead of building the full tree.
+        for _, root in ET.iterparse(cov, events=("start",)):
+            # Cobertura root has attributes like line-rate="0.87"
+            lr = root.attrib.get("line-rate")
+            if lr is not None:
+                pct = round(float(lr) * 100)
+                return f"{pct}%"
+            return None
     except Exception:
         return None
     return None
 
 
+_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+# Positional fields: 0=total width, 1=left width, 2=right width, 3=colour,
+# 4=left text x, 5=right text x, 6=left text, 7=right text.
+_BADGE_TMPL = """<svg xmlns="http://www.w3.org/2000/svg" width="{0}" height="20" role="img" aria-label="{6}: {7}">
+  <linearGradient id="s" x2="0" y2="100%">
+    <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
+    <stop offset="1" stop-opacity=".1"/>
+  </linearGradient>
+  <mask id="m"><rect width="{0}" height="20" rx="3" fill="#fff"/></mask>
+  <g mask="url(#m)">
+    <rect width="{1}" height="20" fill="#555"/>
+    <rect x="{1}" width="{2}" height="20" fill="{3}"/>
+    <rect width="{0}" height="20" fill="url(#s)"/>
+  </g>
+  <g fill="#fff" text-anchor="middle" font-family="DejaVu Sans,Verdana,Geneva,sans-serif" font-size="11">
+    <text x="{4:.1f}" y="14">{6}</text>
+    <text x="{5:.1f}" y="14">{7}</text>
+  </g>
+</svg>"""
+
+
 def svg_badge(left: str, right: str, color: str = "#4c1") -> str:
     """
     Minimal flat-style SVG badge generator (no external deps).
     Width is a heuristic based on text length — fine for CI.
     """
-    left = html.escape(left)
-    right = html.escape(right)
+    left = left.translate(_ESCAPE_TABLE)
+    right = right.translate(_ESCAPE_TABLE)
 
     def width(txt: str) -> int:
         # 6px per char + padding
@@ -135,22 +164,7 @@ def svg_badge(left: str, right: str, color: str = "#4c1") -> str:
     rw = width(right)
     total = lw + rw
 
-    return f"""<svg xmlns="http://www.w3.org/2000/svg" width="{total}" height="20" role="img" aria-label="{left}: {right}">
-  <linearGradient id="s" x2="0" y2="100%">
-    <stop offset="0" stop-color="#bbb" stop-opacity=".1"/>
-    <stop offset="1" stop-opacity=".1"/>
-  </linearGradient>
-  <mask id="m"><rect width="{total}" height="20" rx="3" fill="#fff"/></mask>
-  <g mask="url(#m)">
-    <rect width="{lw}" height="20" fill="#555"/>
-    <rect x="{lw}" width="{rw}" height="20" fill="{color}"/>
-    <rect width="{total}" height="20" fill="url(#s)"/>
-  </g>
-  <g fill="#fff" text-anchor="middle" font-family="DejaVu Sans,Verdana,Geneva,sans-serif" font-size="11">
-    <text x="{lw/2:.1f}" y="14">{left}</text>
-    <text x="{lw + rw/2:.1f}" y="14">{right}</text>
-  </g>
-</svg>"""
+    return _BADGE_TMPL.format(total, lw, rw, color, lw / 2, lw + rw / 2, left, right)
 
 
 def main() -> int:
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Protocol
 
 from ..compare import Impact
@@ -16,6 +17,12 @@ class Analyser(Protocol):
     Analyser implementations capture domain-specific state for a git
     reference and compare two such states to generate :class:`Impact`
     entries describing any public API changes.
+
+    Implementations may also define ``watched_paths()`` returning the
+    directories or files they inspect. When none of the paths changed
+    between two references touch them, the CLI skips the analyser. An
+    optional ``watched_suffixes`` tuple further limits this to changed
+    files with one of those extensions.
     """
 
     def __init__(self, cfg: Config) -> None:
@@ -61,11 +68,38 @@ def register(name: str, description: str | None = None) -> Callable[[type[Analys
     def _wrap(cls: type[Analyser]) -> type[Analyser]:
         desc = description or (cls.__doc__ or "").strip()
         REGISTRY[name] = AnalyserInfo(name=name, cls=cls, description=desc)
+        _resolve.cache_clear()
         return cls
 
     return _wrap
 
 
+@lru_cache(maxsize=8)
+def _resolve(names: tuple[str, ...]) -> tuple[type[Analyser], ...]:
+    """Resolve analyser names to their registered classes.
+
+    Results are cached per name tuple and invalidated whenever a new analyser
+    is registered.
+
+    Args:
+        names: Analyser names to look up.
+
+    Returns:
+        Implementation classes in the order of ``names``.
+
+    Raises:
+        ValueError: If a name is not registered.
+    """
+
+    classes: list[type[Analyser]] = []
+    for name in names:
+        info = REGISTRY.get(name)
+        if info is None:
+            raise ValueError(f"Analyser '{name}' is not registered")
+        classes.append(info.cls)
+    return tuple(classes)
+
+
 def load_enabled(cfg: Config) -> list[Analyser]:
     """Instantiate analysers enabled via configuration.
 
@@ -73,19 +107,13 @@ def load_enabled(cfg: Config) -> list[Analyser]:
         cfg: Global configuration object.
 
     Returns:
-        List of instantiated analysers.
+        List of instantiated analysers, ordered by name.
 
     Raises:
         ValueError: If a configured analyser name is not registered.
     """
 
-    out: list[Analyser] = []
-    for name in cfg.analysers.enabled:
-        info = REGISTRY.get(name)
-        if info is None:
-            raise ValueError(f"Analyser '{name}' is not registered")
-        out.append(info.cls(cfg))
-    return out
+    return [cls(cfg) for cls in _resolve(tuple(sorted(cfg.analysers.enabled)))]
 
 
 def available() -> list[str]:
@@ -8,13 +8,12 @@ from dataclasses import dataclass
 
 from ..compare import Impact
 from ..config import Config
-from ..gitutils import list_py_files_at_ref
 from ..types import BumpLevel
 from . import register
-from .utils import _is_const_str, parse_python_source
+from .utils import _is_const_str, iter_py_trees_at_ref
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Command:
     """Represent a CLI command and its options."""
 
@@ -194,10 +193,8 @@ def _build_cli_at_ref(ref: str, roots: Iterable[str], ignores: Iterable[str]) ->
     """
 
     out: dict[str, Command] = {}
-    for path in list_py_files_at_ref(ref, roots, ignore_globs=ignores):
-        tree = parse_python_source(ref, path)
-        if tree is not None:
-            out.update(extract_cli_from_source(tree))
+    for _path, tree in iter_py_trees_at_ref(ref, roots, ignore_globs=ignores):
+        out.update(extract_cli_from_source(tree))
     return out
 
 
@@ -205,10 +202,21 @@ def _build_cli_at_ref(ref: str, roots: Iterable[str], ignores: Iterable[str]) ->
 class CLIAnalyser:
     """Analyser plugin for command-line interfaces."""
 
+    watched_suffixes: tuple[str, ...] = (".py",)
+
     def __init__(self, cfg: Config) -> None:
         """Initialize the analyser with configuration."""
         self.cfg = cfg
 
+    def watched_paths(self) -> list[str]:
+        """Return paths whose changes can affect this analyser.
+
+        Returns:
+            Directories or files containing the Python modules inspected.
+        """
+
+        return list(self.cfg.project.public_roots)
+
     def collect(self, ref: str) -> dict[str, Command]:
         """Collect CLI commands at the given ref.
 
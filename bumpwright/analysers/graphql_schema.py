@@ -2,28 +2,18 @@
 
 from __future__ import annotations
 
+import os
 from collections.abc import Iterable
 from dataclasses import dataclass
-from fnmatch import fnmatch
 from pathlib import Path
 
-from graphql import parse
-from graphql.language import (
-    EnumTypeDefinitionNode,
-    InputObjectTypeDefinitionNode,
-    InterfaceTypeDefinitionNode,
-    ObjectTypeDefinitionNode,
-    ScalarTypeDefinitionNode,
-    UnionTypeDefinitionNode,
-)
-
 from ..compare import Impact
 from ..config import Config
-from ..gitutils import _run, read_files_at_ref
+from ..gitutils import _compile_ignores, _run, read_files_at_ref
 from . import register
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TypeDef:
     """Represent a GraphQL type and its fields."""
 
@@ -41,6 +31,17 @@ def extract_types_from_schema(sdl: str) -> dict[str, TypeDef]:
         Mapping of type name to :class:`TypeDef` objects.
     """
 
+    # graphql-core is slow to import; defer it until a schema is actually parsed.
+    from graphql import parse  # noqa: PLC0415
+    from graphql.language import (  # noqa: PLC0415
+        EnumTypeDefinitionNode,
+        InputObjectTypeDefinitionNode,
+        InterfaceTypeDefinitionNode,
+        ObjectTypeDefinitionNode,
+        ScalarTypeDefinitionNode,
+        UnionTypeDefinitionNode,
+    )
+
     doc = parse(sdl)
     out: dict[str, TypeDef] = {}
     for defn in doc.definitions:
@@ -97,13 +98,14 @@ def _list_graphql_files_at_ref(
     out = _run(["git", "ls-tree", "-r", "--name-only", ref], cwd)
     paths: set[str] = set()
     roots_norm = [str(Path(r)) for r in roots]
+    ignore = _compile_ignores(tuple(ignore_globs))
     for line in out.splitlines():
         if not line.endswith(".graphql"):
             continue
         p = Path(line)
         if any(str(p).startswith(r.rstrip("/") + "/") or str(p) == r for r in roots_norm):
             s = str(p)
-            if ignore_globs and any(fnmatch(s, pat) for pat in ignore_globs):
+            if ignore is not None and ignore.match(os.path.normcase(s)):
                 continue
             paths.add(s)
     return paths
@@ -126,11 +128,18 @@ def _build_schema_at_ref(ref: str, roots: Iterable[str], ignores: Iterable[str],
 class GraphQLAnalyser:
     """Analyser plugin for GraphQL schemas."""
 
+    watched_suffixes: tuple[str, ...] = (".graphql",)
+
     def __init__(self, cfg: Config) -> None:
         """Initialize the analyser with configuration."""
 
         self.cfg = cfg
 
+    def watched_paths(self) -> list[str]:
+        """Return roots containing the GraphQL schema files inspected."""
+
+        return list(self.cfg.project.public_roots)
+
     def collect(self, ref: str) -> dict[str, TypeDef]:
         """Collect GraphQL types at the given ref."""
 
@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
+import os
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass
-from fnmatch import fnmatch
 from functools import lru_cache
 from pathlib import Path
 
 from ..compare import Impact
 from ..config import Config
-from ..gitutils import _run, read_files_at_ref
+from ..gitutils import _compile_ignores, _run, read_files_at_ref
 from . import register
 
 SERVICE_RE = re.compile(r"\bservice\s+(\w+)\s*\{")
 RPC_RE = re.compile(r"\brpc\s+(\w+)\s*\(")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Service:
     """Representation of a gRPC service."""
 
@@ -77,13 +77,14 @@ def _list_proto_files_at_ref_cached(
     out = _run(["git", "ls-tree", "-r", "--name-only", ref], cwd)
     paths: set[str] = set()
     roots_norm = [str(Path(r)) for r in roots]
+    ignore = _compile_ignores(ignore_globs)
     for line in out.splitlines():
         if not line.endswith(".proto"):
             continue
         p = Path(line)
         if any(str(p).startswith(r.rstrip("/") + "/") or str(p) == r for r in roots_norm):
             s = str(p)
-            if ignore_globs and any(fnmatch(s, pat) for pat in ignore_globs):
+            if ignore is not None and ignore.match(os.path.normcase(s)):
                 continue
             paths.add(s)
     return frozenset(paths)
@@ -101,7 +102,10 @@ def list_proto_files_at_ref(
     return set(_list_proto_files_at_ref_cached(ref, roots_tuple, ignores_tuple, cwd))
 
 
-list_proto_files_at_ref.cache_clear = _list_proto_files_at_ref_cached.cache_clear  # type: ignore[attr-defined]
+def clear_caches() -> None:
+    """Drop cached ``.proto`` listings, which are keyed by reference names."""
+
+    _list_proto_files_at_ref_cached.cache_clear()
 
 
 def _build_services_at_ref(ref: str, roots: Iterable[str], ignores: Iterable[str]) -> dict[str, Service]:
@@ -155,10 +159,21 @@ def diff_services(old: dict[str, Service], new: dict[str, Service]) -> list[Impa
 class GrpcAnalyser:
     """Analyser plugin for gRPC `.proto` definitions."""
 
+    watched_suffixes: tuple[str, ...] = (".proto",)
+
     def __init__(self, cfg: Config) -> None:
         """Initialize the analyser with configuration."""
         self.cfg = cfg
 
+    def watched_paths(self) -> list[str]:
+        """Return paths whose changes can affect this analyser.
+
+        Returns:
+            Directories or files containing the protobuf files inspected.
+        """
+
+        return list(self.cfg.project.public_roots)
+
     def collect(self, ref: str) -> dict[str, Service]:
         """Collect gRPC service definitions at ``ref``.
 
@@ -8,6 +8,7 @@ impacts so they can influence semantic version recommendations.
 from __future__ import annotations
 
 import ast
+from collections.abc import Callable
 from pathlib import Path
 
 from ..compare import Impact
@@ -17,7 +18,11 @@ from . import register
 
 
 class _UpgradeVisitor(ast.NodeVisitor):
-    """AST visitor that records schema-changing operations."""
+    """AST visitor that records schema-changing operations.
+
+    The visitor is run over the statements of top-level ``upgrade``
+    functions only; see :func:`_analyze_content`.
+    """
 
     def __init__(self, path: str) -> None:
         """Create a visitor for a specific migration file.
@@ -32,27 +37,14 @@ class _UpgradeVisitor(ast.NodeVisitor):
     def visit_Call(self, node: ast.Call) -> None:  # noqa: D401
         """Record relevant Alembic operations."""
 
-        if isinstance(node.func, ast.Attribute) and isinstance(node.func.value, ast.Name):
-            if node.func.value.id == "op":
-                attr = node.func.attr
-                if attr == "drop_column":
-                    self.impacts.append(Impact("major", self.path, "Dropped column"))
-                elif attr == "add_column":
-                    impact = _analyze_add_column(node, self.path)
-                    if impact:
-                        self.impacts.append(impact)
-                elif attr == "create_index":
-                    self.impacts.append(Impact("minor", self.path, "Added index"))
-                elif attr == "drop_table":
-                    self.impacts.append(Impact("major", self.path, "Dropped table"))
-                elif attr == "rename_column":
-                    self.impacts.append(Impact("major", self.path, "Renamed column"))
-                elif attr == "alter_column":
-                    impact = _analyze_alter_column(node, self.path)
-                    if impact:
-                        self.impacts.append(impact)
-                elif attr == "drop_index":
-                    self.impacts.append(Impact("minor", self.path, "Dropped index"))
+        func = node.func
+        # Exact type checks are cheaper than isinstance() on this hot path.
+        if type(func) is ast.Attribute and type(func.value) is ast.Name and func.value.id == "op":
+            handler = _OP_HANDLERS.get(func.attr)
+            if handler is not None:
+                impact = handler(node, self.path)
+                if impact:
+                    self.impacts.append(impact)
         self.generic_visit(node)
 
 
@@ -107,6 +99,18 @@ def _analyze_alter_column(node: ast.Call, path: str) -> Impact | None:
     return Impact("major", path, "Altered column")
 
 
+_OP_HANDLERS: dict[str, Callable[[ast.Call, str], Impact | None]] = {
+    "drop_column": lambda _node, path: Impact("major", path, "Dropped column"),
+    "add_column": _analyze_add_column,
+    "create_index": lambda _node, path: Impact("minor", path, "Added index"),
+    "drop_table": lambda _node, path: Impact("major", path, "Dropped table"),
+    "rename_column": lambda _node, path: Impact("major", path, "Renamed column"),
+    "alter_column": _analyze_alter_column,
+    "drop_index": lambda _node, path: Impact("minor", path, "Dropped index"),
+}
+"""Handlers keyed on the ``op.<name>`` attribute of Alembic calls."""
+
+
 def _analyze_content(path: str, content: str) -> list[Impact]:
     """Parse migration source and collect impacts.
 
@@ -118,19 +122,23 @@ def _analyze_content(path: str, content: str) -> list[Impact]:
         List of detected impacts within the migration.
     """
 
+    # Cheap substring scans avoid parsing files that cannot contain any
+    # recognised ``op.<name>`` call inside an ``upgrade`` function.
+    if "op." not in content or "upgrade" not in content:
+        return []
+    if not any(name in content for name in _OP_HANDLERS):
+        return []
     try:
         tree = ast.parse(content)
     except SyntaxError:
         return []
 
-    impacts: list[Impact] = []
+    visitor = _UpgradeVisitor(path)
     for node in tree.body:
-        if isinstance(node, ast.FunctionDef) and node.name == "upgrade":
-            visitor = _UpgradeVisitor(path)
+        if type(node) is ast.FunctionDef and node.name == "upgrade":
             for stmt in node.body:
                 visitor.visit(stmt)
-            impacts.extend(visitor.impacts)
-    return impacts
+    return visitor.impacts
 
 
 def analyze_migrations(base: str, head: str, config: Migrations, cwd: str | Path | None = None) -> list[Impact]:
@@ -146,13 +154,13 @@ def analyze_migrations(base: str, head: str, config: Migrations, cwd: str | Path
         List of detected schema change impacts.
     """
 
-    dirs = [str(Path(p)) for p in config.paths]
-    relevant: list[str] = []
-    for path in changed_paths(base, head, cwd=cwd):
-        if not path.endswith(".py"):
-            continue
-        if any(path == d or path.startswith(f"{d}/") for d in dirs):
-            relevant.append(path)
+    dirs = frozenset(str(Path(p)) for p in config.paths)
+    prefixes = tuple(f"{d}/" for d in dirs)
+    relevant = [
+        path
+        for path in changed_paths(base, head, cwd=cwd)
+        if path.endswith(".py") and (path.startswith(prefixes) or path in dirs)
+    ]
     contents = read_files_at_ref(head, relevant, cwd=cwd)
     impacts: list[Impact] = []
     for path, content in contents.items():
@@ -166,6 +174,8 @@ def analyze_migrations(base: str, head: str, config: Migrations, cwd: str | Path
 class MigrationsAnalyser:
     """Analyser plugin for Alembic migrations."""
 
+    watched_suffixes: tuple[str, ...] = (".py",)
+
     def __init__(self, cfg: Config) -> None:
         """Initialize the analyser with configuration.
 
@@ -175,6 +185,15 @@ class MigrationsAnalyser:
 
         self.cfg = cfg
 
+    def watched_paths(self) -> list[str]:
+        """Return paths whose changes can affect this analyser.
+
+        Returns:
+            Directories or files containing the migration scripts inspected.
+        """
+
+        return list(self.cfg.migrations.paths)
+
     def collect(self, ref: str) -> str:
         """Collect analyser state for ``ref``.
 
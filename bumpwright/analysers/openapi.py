@@ -5,13 +5,27 @@ Parses OpenAPI YAML or JSON documents to detect endpoint and schema changes.
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass
+import sys
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:  # pragma: no cover - optional speed-up
+    from orjson import loads as _json_loads
+except ModuleNotFoundError:  # pragma: no cover
+    from json import loads as _json_loads
+
+try:  # pragma: no cover - depends on libyaml availability
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _Loader  # type: ignore[assignment]
+
 from ..compare import Impact
 from ..config import Config
 from ..gitutils import read_files_at_ref
@@ -19,8 +33,28 @@ from . import register
 
 logger = logging.getLogger(__name__)
 
+# Parsed specs keyed by a digest of their source, shared across references.
+_SPEC_CACHE_SIZE = 128
+_SPEC_CACHE: dict[bytes, Spec] = {}
+_SPEC_CACHE_LOCK = threading.Lock()
 
-@dataclass(frozen=True)
+# Path item keys that describe operations, mapped to their upper-case form.
+# Others such as ``summary`` or ``servers`` are metadata, not endpoints.
+_HTTP_METHODS: dict[str, str] = {
+    "get": "GET",
+    "put": "PUT",
+    "post": "POST",
+    "delete": "DELETE",
+    "options": "OPTIONS",
+    "head": "HEAD",
+    "patch": "PATCH",
+    "trace": "TRACE",
+}
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
 class Operation:
     """Details of a single API operation."""
 
@@ -33,14 +67,86 @@ class Spec:
     """Collected data from an OpenAPI specification.
 
     Attributes:
-        endpoints: Set of ``(path, method)`` tuples for all operations.
+        endpoints: Frozen set of ``(path, method)`` tuples for all operations.
         schemas: Mapping of component schema names to their definitions.
         operations: Mapping of endpoints to operation details.
+        schemas_hash: Content digests of ``schemas`` entries. Schemas that
+            cannot be serialised canonically have no digest.
     """
 
-    endpoints: set[tuple[str, str]]
+    endpoints: frozenset[tuple[str, str]]
     schemas: dict[str, Any]
     operations: dict[tuple[str, str], Operation]
+    schemas_hash: dict[str, bytes] = field(default_factory=dict)
+
+
+def _hash_schema(schema: Any) -> bytes | None:
+    """Return a stable digest of a schema definition.
+
+    Args:
+        schema: Deserialized schema definition.
+
+    Returns:
+        16-byte digest of the canonical JSON encoding, or ``None`` when the
+        schema is not JSON serialisable (for example YAML dates or
+        recursive anchors) or has non-string keys, which JSON would encode
+        like their string form.
+    """
+
+    if not _has_str_keys(schema):
+        return None
+    try:
+        encoded = json.dumps(schema, sort_keys=True, separators=(",", ":")).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+def _has_str_keys(value: Any) -> bool:
+    """Return whether every mapping nested in ``value`` has only string keys."""
+
+    stack = [value]
+    seen: set[int] = set()
+    while stack:
+        item = stack.pop()
+        if isinstance(item, (dict, list)):
+            # Recursive YAML anchors nest a container inside itself.
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+        if isinstance(item, dict):
+            if not all(isinstance(key, str) for key in item):
+                return False
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+    return True
+
+
+def _load_document(content: str) -> Any:
+    """Deserialize a YAML or JSON document.
+
+    JSON documents are decoded with ``orjson`` when installed, or
+    :func:`json.loads` otherwise, both considerably faster than YAML parsing.
+    Anything else, including flow-style YAML that merely looks like JSON, is
+    handled by the libyaml-backed loader when it is available.
+
+    Args:
+        content: YAML or JSON formatted text.
+
+    Returns:
+        Deserialized document.
+
+    Raises:
+        yaml.YAMLError: If the document is neither valid JSON nor valid YAML.
+    """
+
+    if content.lstrip()[:1] in ("{", "["):
+        try:
+            return _json_loads(content)
+        except ValueError:
+            pass
+    return yaml.load(content, Loader=_Loader)
 
 
 def _parse_spec(content: str) -> Spec:
@@ -58,20 +164,21 @@ def _parse_spec(content: str) -> Spec:
     """
 
     try:
-        data = yaml.safe_load(content) or {}
+        data = _load_document(content) or {}
     except yaml.YAMLError as exc:
         logger.warning("Failed to parse OpenAPI spec: %s", exc)
-        return Spec(endpoints=set(), schemas={}, operations={})
+        return Spec(endpoints=frozenset(), schemas={}, operations={})
     paths: dict[str, dict[str, Any]] = data.get("paths", {})
-    endpoints: set[tuple[str, str]] = set()
     operations: dict[tuple[str, str], Operation] = {}
-    for path, path_item in paths.items():
+    for raw_path, path_item in paths.items():
+        # Interned strings share storage across refs and compare by identity.
+        path = sys.intern(raw_path) if isinstance(raw_path, str) else raw_path
         path_params = {(p.get("name", ""), p.get("in", "")): p.get("required", False) for p in path_item.get("parameters", [])}
         for method, op in path_item.items():
-            if method == "parameters":
+            # Doubles as the operation filter and the upper-casing step.
+            meth = _HTTP_METHODS.get(method)
+            if meth is None:
                 continue
-            meth = method.upper()
-            endpoints.add((path, meth))
             op_params = path_params.copy()
             for param in op.get("parameters", []):
                 key = (param.get("name", ""), param.get("in", ""))
@@ -83,7 +190,47 @@ def _parse_spec(content: str) -> Spec:
                     responses[status] = schema
             operations[(path, meth)] = Operation(parameters=op_params, responses=responses)
     schemas = data.get("components", {}).get("schemas", {})
-    return Spec(endpoints=endpoints, schemas=schemas, operations=operations)
+    schemas_hash = {name: digest for name, schema in schemas.items() if (digest := _hash_schema(schema)) is not None}
+    # Every operation key is an endpoint, so build the set in one C-level pass.
+    return Spec(
+        endpoints=frozenset(operations),
+        schemas=schemas,
+        operations=operations,
+        schemas_hash=schemas_hash,
+    )
+
+
+def _parse_spec_memoized(content: str) -> Spec:
+    """Parse ``content`` through the digest-keyed spec cache.
+
+    Only the digest of each document is kept as a key, so lookups hash the
+    text once and the cache does not retain document sources.
+
+    Args:
+        content: YAML or JSON formatted OpenAPI document.
+
+    Returns:
+        Parsed :class:`Spec`. Callers must treat the result as read-only since
+        it may be shared between git references.
+    """
+
+    key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    spec = _SPEC_CACHE.get(key)
+    if spec is None:
+        spec = _parse_spec(content)
+        with _SPEC_CACHE_LOCK:
+            while len(_SPEC_CACHE) >= _SPEC_CACHE_SIZE:
+                # Evict the oldest entry; dicts preserve insertion order.
+                _SPEC_CACHE.pop(next(iter(_SPEC_CACHE)))
+            _SPEC_CACHE[key] = spec
+    return spec
+
+
+def clear_caches() -> None:
+    """Drop parsed specs memoized by :func:`_parse_spec_memoized`."""
+
+    with _SPEC_CACHE_LOCK:
+        _SPEC_CACHE.clear()
 
 
 def diff_specs(old: Spec, new: Spec) -> list[Impact]:
@@ -98,21 +245,36 @@ def diff_specs(old: Spec, new: Spec) -> list[Impact]:
     """
 
     impacts: list[Impact] = []
-    for ep in old.endpoints - new.endpoints:
-        impacts.append(Impact("major", f"{ep[1]} {ep[0]}", "Removed endpoint"))
-    for ep in new.endpoints - old.endpoints:
-        impacts.append(Impact("minor", f"{ep[1]} {ep[0]}", "Added endpoint"))
-    for name in old.schemas.keys() - new.schemas.keys():
-        impacts.append(Impact("major", name, "Removed schema"))
-    for name in new.schemas.keys() - old.schemas.keys():
-        impacts.append(Impact("minor", name, "Added schema"))
-    for name in old.schemas.keys() & new.schemas.keys():
-        if old.schemas[name] != new.schemas[name]:
+    for ep in old.endpoints ^ new.endpoints:
+        if ep in old.endpoints:
+            impacts.append(Impact("major", f"{ep[1]} {ep[0]}", "Removed endpoint"))
+        else:
+            impacts.append(Impact("minor", f"{ep[1]} {ep[0]}", "Added endpoint"))
+
+    new_schemas = new.schemas
+    for name, schema in old.schemas.items():
+        other = new_schemas.get(name, _MISSING)
+        if other is _MISSING:
+            impacts.append(Impact("major", name, "Removed schema"))
+            continue
+        # Identity check first: schemas shared via the parse cache are equal.
+        if other is schema:
+            continue
+        # Equal digests prove equality; differing ones may still be equal
+        # values such as ``1`` and ``1.0``, so confirm with a full comparison.
+        old_hash = old.schemas_hash.get(name)
+        if old_hash is not None and old_hash == new.schemas_hash.get(name):
+            continue
+        if other != schema:
             impacts.append(Impact("major", name, "Changed schema"))
+    for name in new_schemas.keys() - old.schemas.keys():
+        impacts.append(Impact("minor", name, "Added schema"))
 
     for ep in old.operations.keys() & new.operations.keys():
         old_op = old.operations[ep]
         new_op = new.operations[ep]
+        if old_op is new_op:
+            continue
 
         for param in old_op.parameters.keys() - new_op.parameters.keys():
             impacts.append(Impact("major", f"{ep[1]} {ep[0]}", f"Removed parameter {param[0]}"))
@@ -162,9 +324,21 @@ class OpenAPIAnalyser:
 
         self.cfg = cfg
 
+    def watched_paths(self) -> list[str]:
+        """Return paths whose changes can affect this analyser.
+
+        Returns:
+            Directories or files containing the specification documents inspected.
+        """
+
+        return list(self.cfg.openapi.paths)
+
     def collect(self, ref: str) -> Spec:
         """Collect OpenAPI spec data at ``ref``.
 
+        Documents are memoized by content digest, so specs that are
+        unchanged between references are only parsed once.
+
         Args:
             ref: Git reference to read from.
 
@@ -174,17 +348,27 @@ class OpenAPIAnalyser:
 
         paths = [str(Path(p)) for p in self.cfg.openapi.paths]
         contents = read_files_at_ref(ref, paths)
+        documents = [c for c in contents.values() if c is not None]
+        # Parsing is CPU-bound and holds the GIL, so it runs serially.
+        specs = [_parse_spec_memoized(c) for c in documents]
         endpoints: set[tuple[str, str]] = set()
         schemas: dict[str, Any] = {}
+        schemas_hash: dict[str, bytes] = {}
         operations: dict[tuple[str, str], Operation] = {}
-        for content in contents.values():
-            if content is None:
-                continue
-            spec = _parse_spec(content)
+        for spec in specs:
             endpoints |= spec.endpoints
             schemas.update(spec.schemas)
+            # Drop digests of schemas overridden by a later unhashable definition.
+            for name in spec.schemas.keys() - spec.schemas_hash.keys():
+                schemas_hash.pop(name, None)
+            schemas_hash.update(spec.schemas_hash)
             operations.update(spec.operations)
-        return Spec(endpoints=endpoints, schemas=schemas, operations=operations)
+        return Spec(
+            endpoints=frozenset(endpoints),
+            schemas=schemas,
+            operations=operations,
+            schemas_hash=schemas_hash,
+        )
 
     def compare(self, old: Spec, new: Spec) -> list[Impact]:
         """Compare two collected specs and report impacts."""
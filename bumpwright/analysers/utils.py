@@ -3,14 +3,38 @@
 from __future__ import annotations
 
 import ast
+import atexit
+import hashlib
 import logging
-from collections.abc import Iterable, Iterator
+import os
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from functools import lru_cache
+from typing import TYPE_CHECKING, TypeVar
 
-from ..gitutils import list_py_files_at_ref, read_file_at_ref, read_files_at_ref
+from .. import gitutils
+from ..gitutils import iter_files_at_ref, list_py_files_with_sha, read_file_at_ref
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Hosts with this many CPUs or fewer always analyse sources serially.
+_MIN_PARALLEL_CPUS = 2
+# Batches smaller than this finish faster serially than via worker processes.
+_MIN_PARALLEL_ITEMS = 16
+# Work items reach each worker in about this many chunks, balancing uneven
+# file sizes against the cost of sending each chunk.
+_CHUNKS_PER_WORKER = 4
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Worker pools shared by every map_sources call, keyed by worker count.
+_EXECUTORS: dict[int, ProcessPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
 
 def _is_const_str(node: ast.AST) -> bool:
     """Return whether ``node`` is an ``ast.Constant`` string.
@@ -25,13 +49,31 @@ def _is_const_str(node: ast.AST) -> bool:
     return isinstance(node, ast.Constant) and isinstance(node.value, str)
 
 
-@lru_cache(maxsize=None)
+@lru_cache(maxsize=4096)
+def _parse_cached(code_hash: bytes, code: str) -> ast.AST:
+    """Parse ``code`` with results shared across references.
+
+    Args:
+        code_hash: Digest of ``code`` identifying identical sources.
+        code: Python source text.
+
+    Returns:
+        Parsed module AST. Callers must not mutate the tree since it may be
+        shared by every reference containing the same source.
+    """
+
+    return ast.parse(code)
+
+
 def parse_python_source(ref: str, path: str, cwd: str | None = None) -> ast.AST | None:
     """Return the parsed AST for ``path`` at ``ref``.
 
     Results are cached per ``(ref, path, cwd)`` to avoid repeated git
-    lookups and ``ast.parse`` calls when analysers inspect the same files
-    multiple times. Invalid or unreadable files are skipped.
+    lookups when analysers inspect the same files multiple times. The key is
+    the same whether or not ``cwd`` is passed, so the API builder and the
+    analysers share trees. Parsing is additionally keyed on a digest of the
+    source, so a file that is unchanged between references is only parsed
+    once. Invalid or unreadable files are skipped.
 
     Args:
         ref: Git reference of the file to parse.
@@ -43,11 +85,19 @@ def parse_python_source(ref: str, path: str, cwd: str | None = None) -> ast.AST
         invalid at ``ref``.
     """
 
+    return _parse_python_source_cached(ref, path, cwd)
+
+
+@lru_cache(maxsize=None)
+def _parse_python_source_cached(ref: str, path: str, cwd: str | None) -> ast.AST | None:
+    """Read and parse :func:`parse_python_source` results once per key."""
+
     code = read_file_at_ref(ref, path, cwd=cwd)
     if code is None:
         return None
+    key = hashlib.blake2b(code.encode(), digest_size=16).digest()
     try:
-        return ast.parse(code)
+        return _parse_cached(key, code)
     except (SyntaxError, UnicodeDecodeError):
         logger.warning("Failed to parse %s at %s", path, ref)
         return None
@@ -61,6 +111,9 @@ def iter_py_files_at_ref(
 ) -> Iterator[tuple[str, str]]:
     """Yield Python file paths and contents for a git reference.
 
+    Contents are streamed from a single git process, so each file is
+    yielded as soon as it has been read rather than after the whole batch.
+
     Args:
         ref: Git reference to inspect.
         roots: Root directories to search for Python modules.
@@ -68,20 +121,122 @@ def iter_py_files_at_ref(
         cwd: Repository path in which to run git commands.
 
     Yields:
-        Tuples of ``(path, source)`` for each discovered Python file.
+        Tuples of ``(path, source)`` for each discovered Python file in
+        sorted path order.
     """
 
-    paths = list(list_py_files_at_ref(ref, roots, ignore_globs=ignore_globs, cwd=cwd))
-    contents = read_files_at_ref(ref, paths, cwd=cwd)
-    for path in paths:
-        code = contents.get(path)
+    paths = [path for path, _sha in list_py_files_with_sha(ref, roots, ignore_globs=ignore_globs, cwd=cwd)]
+    for path, code in iter_files_at_ref(ref, paths, cwd=cwd):
         if code is not None:
             yield path, code
 
 
+def iter_py_trees_at_ref(
+    ref: str,
+    roots: Iterable[str],
+    ignore_globs: Iterable[str] | None = None,
+    cwd: str | None = None,
+) -> Iterator[tuple[str, ast.AST]]:
+    """Yield parsed ASTs for Python files under ``roots`` at ``ref``.
+
+    Each file is parsed as soon as its contents arrive from
+    :func:`iter_py_files_at_ref`. Trees come from
+    :func:`parse_python_source`, so they are shared with any other analyser
+    inspecting the same files. Invalid files are skipped.
+
+    Args:
+        ref: Git reference to inspect.
+        roots: Root directories to search for Python modules.
+        ignore_globs: Optional glob patterns to exclude.
+        cwd: Repository path in which to run git commands.
+
+    Yields:
+        Tuples of ``(path, tree)`` in sorted path order.
+    """
+
+    for path, _code in iter_py_files_at_ref(ref, roots, ignore_globs=ignore_globs, cwd=cwd):
+        tree = parse_python_source(ref, path, cwd)
+        if tree is not None:
+            yield path, tree
+
+
+def resolve_jobs(jobs: int) -> int:
+    """Return the effective number of worker processes for ``jobs``.
+
+    Args:
+        jobs: Requested worker count. ``0`` selects every available CPU.
+
+    Returns:
+        Worker count to use. Always ``1`` on hosts with two or fewer CPUs,
+        where process start-up costs outweigh any parallel speed-up.
+    """
+
+    cpus = os.cpu_count() or 1
+    if cpus <= _MIN_PARALLEL_CPUS:
+        return 1
+    return cpus if jobs == 0 else max(1, jobs)
+
+
+def _executor(workers: int) -> ProcessPoolExecutor:
+    """Return a shared process pool with ``workers`` processes.
+
+    Pools are created on first use and kept for the rest of the process so
+    that base and head extraction share worker start-up costs.
+    """
+
+    with _EXECUTORS_LOCK:
+        ex = _EXECUTORS.get(workers)
+        if ex is None:
+            # The process pool machinery is only imported when work is actually fanned out.
+            import multiprocessing  # noqa: PLC0415
+            from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+            if not _EXECUTORS:
+                atexit.register(shutdown_executors)
+            # Workers are forked from a single-threaded server rather than from
+            # this process, which may have git reader and helper threads running.
+            # Platforms without forkserver keep their default (spawn).
+            context = (
+                multiprocessing.get_context("forkserver")
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else None
+            )
+            ex = _EXECUTORS[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        return ex
+
+
+def shutdown_executors() -> None:
+    """Shut down process pools created by :func:`map_sources`."""
+
+    while _EXECUTORS:
+        _workers, ex = _EXECUTORS.popitem()
+        ex.shutdown()
+
+
+def map_sources(func: Callable[[_T], _R], items: Sequence[_T], jobs: int = 1) -> list[_R]:
+    """Apply ``func`` to ``items`` using up to ``jobs`` worker processes.
+
+    Batches of fewer than 16 items always run in this process.
+
+    Args:
+        func: Picklable top-level callable applied to each item.
+        items: Work items; results are returned in the same order.
+        jobs: Requested worker count as accepted by :func:`resolve_jobs`.
+
+    Returns:
+        List of ``func`` results for each item.
+    """
+
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1 or len(items) < _MIN_PARALLEL_ITEMS:
+        return [func(item) for item in items]
+    chunksize = max(1, len(items) // (workers * _CHUNKS_PER_WORKER))
+    return list(_executor(workers).map(func, items, chunksize=chunksize))
+
+
 def clear_caches() -> None:
-    """Clear caches used by analyser utilities."""
+    """Clear caches used by analyser utilities, including git reads."""
 
-    parse_python_source.cache_clear()
-    list_py_files_at_ref.cache_clear()
-    read_file_at_ref.cache_clear()
+    _parse_python_source_cached.cache_clear()
+    _parse_cached.cache_clear()
+    gitutils.clear_caches()
@@ -10,21 +10,29 @@ registered dynamically or via framework-specific helpers may be missed.
 from __future__ import annotations
 
 import ast
-from collections.abc import Iterable
+import logging
+import sys
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
+from functools import lru_cache, partial
 
 from ..compare import Impact
 from ..config import Config
-from ..gitutils import list_py_files_at_ref
 from . import register
-from .utils import _is_const_str, parse_python_source
+from .utils import _is_const_str, iter_py_files_at_ref, iter_py_trees_at_ref, map_sources, resolve_jobs
 
-HTTP_METHODS = {"GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"}
+logger = logging.getLogger(__name__)
 
+HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Route:
-    """Represent a single HTTP route."""
+    """Represent a single HTTP route.
+
+    Paths, methods, and parameter names are interned so routes repeated
+    across references share their strings.
+    """
 
     path: str
     method: str
@@ -43,11 +51,108 @@ def _extract_params(args: ast.arguments) -> dict[str, bool]:
 
     pos = list(args.posonlyargs) + list(args.args)
     pos_defaults = [None] * (len(pos) - len(args.defaults)) + list(args.defaults)
-    params = {a.arg: d is None for a, d in zip(pos, pos_defaults) if a.arg != "self"}
-    params.update({a.arg: d is None for a, d in zip(args.kwonlyargs, args.kw_defaults)})
+    params = {sys.intern(a.arg): d is None for a, d in zip(pos, pos_defaults) if a.arg != "self"}
+    params.update({sys.intern(a.arg): d is None for a, d in zip(args.kwonlyargs, args.kw_defaults)})
     return params
 
 
+_RouteState = tuple[str | None, Iterable[str] | None]
+
+
+def _flask_route(deco: ast.Call, path: str | None, methods: Iterable[str] | None) -> _RouteState:
+    """Apply a Flask ``@app.route(path, methods=[...])`` decorator.
+
+    Args:
+        deco: Decorator call node.
+        path: Route path collected from earlier decorators.
+        methods: HTTP methods collected from earlier decorators.
+
+    Returns:
+        Updated ``(path, methods)`` pair. Methods default to ``GET``.
+    """
+
+    if deco.args and _is_const_str(deco.args[0]):
+        path = deco.args[0].value  # type: ignore[attr-defined]
+    for kw in deco.keywords:
+        if kw.arg == "methods" and isinstance(kw.value, (ast.List, ast.Tuple)):
+            methods = [elt.value.upper() for elt in kw.value.elts if _is_const_str(elt)]  # type: ignore[attr-defined]
+    if methods is None:
+        methods = ["GET"]
+    return path, methods
+
+
+def _method_route(
+    method: str, deco: ast.Call, path: str | None, methods: Iterable[str] | None
+) -> _RouteState:
+    """Apply a FastAPI-style ``@app.<method>(path)`` decorator.
+
+    Args:
+        method: Upper-case HTTP method named by the decorator.
+        deco: Decorator call node.
+        path: Route path collected from earlier decorators.
+        methods: HTTP methods collected from earlier decorators.
+
+    Returns:
+        Updated ``(path, methods)`` pair, unchanged if the path is not a
+        string literal.
+    """
+
+    if deco.args and _is_const_str(deco.args[0]):
+        return deco.args[0].value, [method]  # type: ignore[attr-defined]
+    return path, methods
+
+
+# Decorator attribute names mapped to their handlers. Keys are lower-case;
+# other spellings fall back to a lower-cased lookup.
+_DECO_HANDLERS: dict[str, Callable[[ast.Call, str | None, Iterable[str] | None], _RouteState]] = {
+    "route": _flask_route,
+    **{m.lower(): partial(_method_route, m) for m in HTTP_METHODS},
+}
+
+
+class _RouteVisitor(ast.NodeVisitor):
+    """Collect decorator-based routes from a module.
+
+    Only statements are traversed: route handlers are always ``def``
+    statements, so expression subtrees are never descended into.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty route mapping."""
+
+        self.routes: dict[tuple[str, str], Route] = {}
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Recurse into nested statements only."""
+
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.stmt, ast.excepthandler, ast.match_case)):
+                self.visit(child)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:  # noqa: D401
+        """Record routes declared by the function's decorators."""
+
+        path = None
+        methods: Iterable[str] | None = None
+        for deco in node.decorator_list:
+            if type(deco) is ast.Call and type(deco.func) is ast.Attribute:
+                attr = deco.func.attr
+                handler = _DECO_HANDLERS.get(attr)
+                if handler is None:
+                    handler = _DECO_HANDLERS.get(attr.lower())
+                    if handler is None:
+                        continue
+                path, methods = handler(deco, path, methods)
+        if path and methods:
+            path = sys.intern(path)
+            params = _extract_params(node.args)
+            for m in map(sys.intern, methods):
+                self.routes[(path, m)] = Route(path, m, params)
+        self.generic_visit(node)
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+
 def extract_routes_from_source(code: str | ast.AST) -> dict[tuple[str, str], Route]:
     """Extract routes from source code.
 
@@ -61,52 +166,77 @@ def extract_routes_from_source(code: str | ast.AST) -> dict[tuple[str, str], Rou
     """
 
     tree = ast.parse(code) if isinstance(code, str) else code
-    routes: dict[tuple[str, str], Route] = {}
+    visitor = _RouteVisitor()
+    visitor.visit(tree)
+    return visitor.routes
+
+
+@lru_cache(maxsize=4096)
+def _routes_from_tree(tree: ast.AST) -> dict[tuple[str, str], Route]:
+    """Return routes for ``tree`` memoized by tree identity.
+
+    Identical sources share one AST across references, so unchanged modules
+    are only scanned once per process.
+
+    Args:
+        tree: Parsed module AST.
+
+    Returns:
+        Mapping of ``(path, method)`` to :class:`Route` objects. The mapping
+        is shared and must not be mutated.
+    """
+
+    return extract_routes_from_source(tree)
 
-    for node in ast.walk(tree):
-        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            continue
-        path = None
-        methods: Iterable[str] | None = None
-        for deco in node.decorator_list:
-            if isinstance(deco, ast.Call) and isinstance(deco.func, ast.Attribute):
-                name = deco.func.attr.lower()
-                if name == "route":  # Flask
-                    if deco.args and _is_const_str(deco.args[0]):
-                        path = deco.args[0].value  # type: ignore[assignment]
-                    for kw in deco.keywords:
-                        if kw.arg == "methods" and isinstance(kw.value, (ast.List, ast.Tuple)):
-                            methods = [elt.value.upper() for elt in kw.value.elts if _is_const_str(elt)]
-                    if methods is None:
-                        methods = ["GET"]
-                elif name.upper() in HTTP_METHODS:  # FastAPI style
-                    if deco.args and _is_const_str(deco.args[0]):
-                        path = deco.args[0].value  # type: ignore[assignment]
-                        methods = [name.upper()]
-        if path and methods:
-            params = _extract_params(node.args)
-            for m in methods:
-                routes[(path, m)] = Route(path, m, params)
-    return routes
 
+def _extract_routes_worker(code: str) -> dict[tuple[str, str], Route] | None:
+    """Extract routes from ``code`` inside a worker process.
 
-def _build_routes_at_ref(ref: str, roots: Iterable[str], ignores: Iterable[str]) -> dict[tuple[str, str], Route]:
+    Args:
+        code: Module source text.
+
+    Returns:
+        Mapping of ``(path, method)`` to :class:`Route` objects or ``None``
+        if the source is invalid.
+    """
+
+    try:
+        return extract_routes_from_source(code)
+    except (SyntaxError, ValueError):
+        return None
+
+
+def _build_routes_at_ref(
+    ref: str,
+    roots: Iterable[str],
+    ignores: Iterable[str],
+    jobs: int = 1,
+) -> dict[tuple[str, str], Route]:
     """Collect routes for all modules under given roots at a git ref.
 
     Args:
         ref: Git reference to inspect.
         roots: Root directories to search for Python modules.
         ignores: Glob patterns to exclude from scanning.
+        jobs: Worker processes used to parse modules; see
+            :func:`~bumpwright.analysers.utils.resolve_jobs`.
 
     Returns:
         Mapping of ``(path, method)`` to :class:`Route` objects present at ``ref``.
     """
 
     out: dict[tuple[str, str], Route] = {}
-    for path in list_py_files_at_ref(ref, roots, ignore_globs=ignores):
-        tree = parse_python_source(ref, path)
-        if tree is not None:
-            out.update(extract_routes_from_source(tree))
+    if resolve_jobs(jobs) > 1:
+        files = list(iter_py_files_at_ref(ref, roots, ignore_globs=ignores))
+        results = map_sources(_extract_routes_worker, [code for _path, code in files], jobs)
+        for (path, _code), routes in zip(files, results):
+            if routes is None:
+                logger.warning("Failed to parse %s at %s", path, ref)
+                continue
+            out.update(routes)
+        return out
+    for _path, tree in iter_py_trees_at_ref(ref, roots, ignore_globs=ignores):
+        out.update(_routes_from_tree(tree))
     return out
 
 
@@ -123,33 +253,43 @@ def diff_routes(old: dict[tuple[str, str], Route], new: dict[tuple[str, str], Ro
 
     impacts: list[Impact] = []
 
-    for key in old.keys() - new.keys():
-        path, method = key
-        impacts.append(Impact("major", f"{method} {path}", "Removed route"))
-
-    for key in new.keys() - old.keys():
+    for key in old.keys() ^ new.keys():
         path, method = key
-        impacts.append(Impact("minor", f"{method} {path}", "Added route"))
+        if key in old:
+            impacts.append(Impact("major", f"{method} {path}", "Removed route"))
+        else:
+            impacts.append(Impact("minor", f"{method} {path}", "Added route"))
 
     for key in old.keys() & new.keys():
-        op = old[key].params
-        np = new[key].params
+        o = old[key]
+        n = new[key]
+        # Unchanged modules share Route objects across refs.
+        if o is n:
+            continue
+        op = o.params
+        np_ = n.params
+        if op == np_:
+            continue
         path, method = key
         symbol = f"{method} {path}"
-        for p in op.keys() - np.keys():
+        op_keys = op.keys()
+        np_keys = np_.keys()
+        for p in op_keys - np_keys:
             if op[p]:
                 impacts.append(Impact("major", symbol, f"Removed required param '{p}'"))
             else:
                 impacts.append(Impact("minor", symbol, f"Removed optional param '{p}'"))
-        for p in np.keys() - op.keys():
-            if np[p]:
+        for p in np_keys - op_keys:
+            if np_[p]:
                 impacts.append(Impact("major", symbol, f"Added required param '{p}'"))
             else:
                 impacts.append(Impact("minor", symbol, f"Added optional param '{p}'"))
-        for p in op.keys() & np.keys():
-            if op[p] and not np[p]:
+        for p in op_keys & np_keys:
+            was_required = op[p]
+            is_required = np_[p]
+            if was_required and not is_required:
                 impacts.append(Impact("minor", symbol, f"Param '{p}' became optional"))
-            if not op[p] and np[p]:
+            elif is_required and not was_required:
                 impacts.append(Impact("major", symbol, f"Param '{p}' became required"))
     return impacts
 
@@ -158,10 +298,21 @@ def diff_routes(old: dict[tuple[str, str], Route], new: dict[tuple[str, str], Ro
 class WebRoutesAnalyser:
     """Analyser plugin for web application routes."""
 
+    watched_suffixes: tuple[str, ...] = (".py",)
+
     def __init__(self, cfg: Config) -> None:
         """Initialize the analyser with configuration."""
         self.cfg = cfg
 
+    def watched_paths(self) -> list[str]:
+        """Return paths whose changes can affect this analyser.
+
+        Returns:
+            Directories or files containing the Python modules inspected.
+        """
+
+        return list(self.cfg.project.public_roots)
+
     def collect(self, ref: str) -> dict[tuple[str, str], Route]:
         """Collect route definitions at ``ref``.
 
@@ -172,7 +323,12 @@ class WebRoutesAnalyser:
             Mapping of ``(path, method)`` to :class:`Route` objects.
         """
 
-        return _build_routes_at_ref(ref, self.cfg.project.public_roots, self.cfg.ignore.paths)
+        return _build_routes_at_ref(
+            ref,
+            self.cfg.project.public_roots,
+            self.cfg.ignore.paths,
+            self.cfg.performance.jobs,
+        )
 
     def compare(self, old: dict[tuple[str, str], Route], new: dict[tuple[str, str], Route]) -> list[Impact]:
         """Compare two route mappings and return impacts.
@@ -0,0 +1,109 @@
+"""Persistent, content-addressed cache for analysis results.
+
+Entries live under the repository's git directory so they never show up as
+untracked files. Each namespace directory embeds the bumpwright version and
+Python version, so upgrading either silently starts a fresh cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from .gitutils import _run
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of cached values changes without a release.
+_FORMAT = 1
+
+
+def cache_root(cwd: str | None = None) -> Path | None:
+    """Return the directory holding bumpwright caches for a repository.
+
+    Args:
+        cwd: Directory inside the repository. Defaults to the current directory.
+
+    Returns:
+        ``<git-dir>/bumpwright`` or ``None`` when ``cwd`` is not inside a git
+        repository.
+    """
+
+    return _cache_root_cached(cwd or os.getcwd())
+
+
+@lru_cache(maxsize=None)
+def _cache_root_cached(cwd: str) -> Path | None:
+    """Resolve and memoise :func:`cache_root` for an explicit directory."""
+
+    try:
+        git_dir = _run(["git", "rev-parse", "--absolute-git-dir"], cwd).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return Path(git_dir) / "bumpwright"
+
+
+def clear_caches() -> None:
+    """Forget resolved cache directories."""
+
+    _cache_root_cached.cache_clear()
+
+
+def _entry_path(root: Path, namespace: str, key: str) -> Path:
+    """Return the file storing ``key`` within ``namespace`` under ``root``."""
+
+    from . import __version__  # noqa: PLC0415  # avoid a cycle through bumpwright.cli
+
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    tag = f"{namespace}-{__version__}-{_FORMAT}-py{sys.version_info[0]}{sys.version_info[1]}"
+    return root / tag / digest[:2] / digest
+
+
+def load(root: Path, namespace: str, key: str) -> Any | None:
+    """Load a cached value.
+
+    Args:
+        root: Cache directory returned by :func:`cache_root`.
+        namespace: Name grouping related entries, such as ``"api"``.
+        key: Content-derived key identifying the entry.
+
+    Returns:
+        The stored value, or ``None`` when the entry is missing or unreadable.
+    """
+
+    try:
+        with _entry_path(root, namespace, key).open("rb") as fh:
+            return pickle.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError) as exc:
+        logger.debug("Ignoring unreadable cache entry for %s: %s", key, exc)
+        return None
+
+
+def store(root: Path, namespace: str, key: str, value: Any) -> None:
+    """Persist ``value`` atomically; failures are logged and ignored.
+
+    Args:
+        root: Cache directory returned by :func:`cache_root`.
+        namespace: Name grouping related entries, such as ``"api"``.
+        key: Content-derived key identifying the entry.
+        value: Picklable value to store.
+    """
+
+    path = _entry_path(root, namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+            pickle.dump(value, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp.name, path)
+    except (OSError, pickle.PicklingError) as exc:
+        logger.debug("Could not write cache entry for %s: %s", key, exc)
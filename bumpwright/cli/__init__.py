@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from functools import lru_cache
 
 from ..analysers import available
 
@@ -51,14 +52,41 @@ def add_analyser_toggles(parser: argparse.ArgumentParser) -> None:
     )
 
 
-from .bump import bump_command  # noqa: E402
-from .init import init_command  # noqa: E402
+def _run_init(args: argparse.Namespace) -> int:
+    """Import and run :func:`~bumpwright.cli.init.init_command`."""
+
+    from .init import init_command  # noqa: PLC0415
+
+    return init_command(args)
+
+
+def _run_bump(args: argparse.Namespace) -> int:
+    """Import and run :func:`~bumpwright.cli.bump.bump_command`.
+
+    The bump module pulls in git, versioning and changelog helpers, so it is
+    only loaded when the subcommand actually runs.
+    """
+
+    from .bump import bump_command  # noqa: PLC0415
+
+    return bump_command(args)
 
 
 def get_parser() -> argparse.ArgumentParser:
-    """Build the argument parser for the command-line interface."""
+    """Return the argument parser for the command-line interface.
 
-    avail = ", ".join(available()) or "none"
+    The parser is built once per set of registered analysers and then reused;
+    ``parse_args`` does not modify it.
+    """
+
+    return _build_parser(tuple(available()))
+
+
+@lru_cache(maxsize=1)
+def _build_parser(analysers: tuple[str, ...]) -> argparse.ArgumentParser:
+    """Build the CLI parser advertising ``analysers`` in its description."""
+
+    avail = ", ".join(analysers) or "none"
     parser = argparse.ArgumentParser(
         prog="bumpwright",
         description=(f"Suggest and apply semantic version bumps. Available analysers: {avail}."),
@@ -79,7 +107,7 @@ def get_parser() -> argparse.ArgumentParser:
             "Create an empty 'chore(release): initialise baseline' commit to establish a comparison point for future bumps."
         ),
     )
-    p_init.set_defaults(func=init_command)
+    p_init.set_defaults(func=_run_init)
 
     p_bump = sub.add_parser(
         "bump",
@@ -155,7 +183,12 @@ def get_parser() -> argparse.ArgumentParser:
         action="append",
         help=("Regex pattern for commit subjects to exclude from changelog (repeatable)."),
     )
-    p_bump.set_defaults(func=bump_command)
+    p_bump.add_argument(
+        "--jobs",
+        type=int,
+        help="Worker processes for source analysis; 0 uses every CPU. Overrides configuration.",
+    )
+    p_bump.set_defaults(func=_run_bump)
     return parser
 
 
@@ -3,33 +3,48 @@
 from __future__ import annotations
 
 import argparse
-import json
 import logging
+import os
 import re
 import subprocess
 from datetime import date
+from functools import lru_cache
 from glob import has_magic
 from pathlib import Path
-from typing import Any, Iterable
-
-from jinja2 import Template
+from typing import TYPE_CHECKING, Any, Iterable
 
+from .. import gitutils
+from ..analysers import grpc
+from ..analysers import utils as analyser_utils
 from ..compare import Decision
 from ..config import Config, load_config
 from ..gitutils import (
+    _compile_ignores,
     changed_paths,
+    collect_commit_messages,
     collect_commits,
     collect_contributors,
     commit_iso_datetime,
-    commit_message,
     last_release_commit,
     tag_for_commit,
 )
 from ..versioning import VersionChange, apply_bump, find_pyproject
-from .decide import _decide_only, _infer_level
+from .decide import _decide_only, _dump_json, _infer_level, _touches
+from .decide import clear_caches as clear_api_caches
+
+if TYPE_CHECKING:
+    from jinja2 import Template
 
 logger = logging.getLogger(__name__)
 
+# Conventional Commits markers for breaking changes: ``type(scope)!:`` in the
+# subject or a ``BREAKING CHANGE:`` footer in the body.
+_BREAKING_SUBJECT = re.compile(r"^[^:!]+(?:\([^)]*\))?!:")
+_BREAKING_FOOTER = re.compile(r"^BREAKING CHANGE:\s*(.+)", re.MULTILINE)
+
+# Environment variable overriding ``[performance].jobs`` when ``--jobs`` is absent.
+_JOBS_ENV = "BUMPWRIGHT_JOBS"
+
 
 def get_default_template() -> str:
     """Return the built-in changelog template text.
@@ -62,6 +77,23 @@ def _read_template(template_path: str | None) -> str:
     return get_default_template()
 
 
+@lru_cache(maxsize=8)
+def _compile_template(text: str) -> Template:
+    """Compile changelog template ``text`` once per process.
+
+    Args:
+        text: Jinja2 template source.
+
+    Returns:
+        Compiled template, shared by every changelog rendered from ``text``.
+    """
+
+    # Jinja2 is only needed when a changelog is rendered.
+    from jinja2 import Template  # noqa: PLC0415
+
+    return Template(text)
+
+
 def _commit_tag(
     files: Iterable[str | Path], version: str, commit: bool, tag: bool
 ) -> None:
@@ -128,9 +160,24 @@ def _resolve_refs(args: argparse.Namespace, level: str | None) -> tuple[str, str
     return base, args.head
 
 
-def _safe_changed_paths(base: str, head: str) -> set[str] | None:
+@lru_cache(maxsize=None)
+def _changed_paths_cached(base: str, head: str, cwd: str) -> frozenset[str] | None:
+    """Return cached changed paths for ``base`` and ``head`` in ``cwd``."""
+
+    try:
+        return frozenset(changed_paths(base, head))
+    except subprocess.CalledProcessError:
+        logger.warning("Failed to compute changed paths between %s and %s", base, head)
+        return None
+
+
+def _safe_changed_paths(base: str, head: str) -> frozenset[str] | None:
     """Return changed paths, handling missing history gracefully.
 
+    Results are cached per working directory so a command diffs each pair
+    of references once. :func:`bump_command` clears the cache on entry via
+    :func:`_reset_ref_caches`.
+
     Args:
         base: Base git reference for comparison.
         head: Head git reference for comparison.
@@ -139,11 +186,23 @@ def _safe_changed_paths(base: str, head: str) -> set[str] | None:
         A set of changed paths or ``None`` when the diff cannot be determined.
     """
 
-    try:
-        return changed_paths(base, head)
-    except subprocess.CalledProcessError:
-        logger.warning("Failed to compute changed paths between %s and %s", base, head)
-        return None
+    return _changed_paths_cached(base, head, os.getcwd())
+
+
+def _reset_ref_caches() -> None:
+    """Drop memoised results keyed by symbolic refs such as ``HEAD``.
+
+    Release lookups, changed paths, file listings, file contents, parsed
+    trees and built APIs are cached per reference name, so all of them go
+    stale once a commit or tag moves the reference. Per-blob module APIs and
+    parsed OpenAPI specs are keyed by content and kept.
+    """
+
+    _changed_paths_cached.cache_clear()
+    clear_api_caches()
+    # Also clears the gitutils listing, read and release caches.
+    analyser_utils.clear_caches()
+    grpc.clear_caches()
 
 
 def _build_changelog(args: argparse.Namespace, new_version: str) -> str | None:
@@ -178,25 +237,23 @@ def _build_changelog(args: argparse.Namespace, new_version: str) -> str | None:
     base = last_release_commit() or f"{args.head}^"
     prev_tag = tag_for_commit(base)
     commits = collect_commits(base, args.head)
+    try:
+        messages = collect_commit_messages(base, args.head)
+    except subprocess.CalledProcessError:
+        messages = {}
     patterns = [re.compile(p) for p in getattr(args, "changelog_exclude", [])]
+    base_url = args.repo_url.rstrip("/") if args.repo_url else None
     entries: list[dict[str, Any]] = []
     breaking: list[str] = []
     for sha, subject in commits:
         if any(p.search(subject) for p in patterns):
             continue
-        link = None
-        if args.repo_url:
-            base_url = args.repo_url.rstrip("/")
-            link = f"{base_url}/commit/{sha}"
+        link = f"{base_url}/commit/{sha}" if base_url else None
         entries.append({"sha": sha, "subject": subject, "link": link})
-        try:
-            message = commit_message(sha)
-        except subprocess.CalledProcessError:
-            message = ""
-        if re.match(r"^[^:!]+(?:\([^)]*\))?!:", subject):
+        if _BREAKING_SUBJECT.match(subject):
             breaking.append(subject)
         else:
-            m = re.search(r"^BREAKING CHANGE:\s*(.+)", message, re.MULTILINE)
+            m = _BREAKING_FOOTER.search(messages.get(sha, ""))
             if m:
                 breaking.append(m.group(1).strip() or subject)
 
@@ -210,11 +267,10 @@ def _build_changelog(args: argparse.Namespace, new_version: str) -> str | None:
         contributors.append({"name": name, "link": link})
 
     compare_url = None
-    if args.repo_url and prev_tag:
-        base_url = args.repo_url.rstrip("/")
+    if base_url and prev_tag:
         compare_url = f"{base_url}/compare/{prev_tag}...v{new_version}"
 
-    tmpl = Template(_read_template(getattr(args, "changelog_template", None)))
+    tmpl = _compile_template(_read_template(getattr(args, "changelog_template", None)))
     rendered = tmpl.render(
         version=new_version,
         date=date.today().isoformat(),
@@ -229,6 +285,50 @@ def _build_changelog(args: argparse.Namespace, new_version: str) -> str | None:
     return rendered.rstrip() + "\n"
 
 
+def _relevant_changes(
+    changed: Iterable[str], pyproject: Path, paths: Iterable[str], cfg: Config | None = None
+) -> frozenset[str]:
+    """Drop version metadata and ignored files from a set of changed paths.
+
+    With ``cfg``, paths matching ``[ignore].paths`` are dropped as well,
+    unless they fall under the OpenAPI or migration paths, whose analysers
+    do not honour those globs.
+
+    Args:
+        changed: Paths changed between two references.
+        pyproject: Path to the canonical ``pyproject.toml`` file.
+        paths: Version file patterns; only literal paths are removed.
+        cfg: Project configuration supplying ignore globs, or ``None`` to
+            keep ignored paths.
+
+    Returns:
+        Changed paths that may affect the public API.
+    """
+
+    version_files = {p for p in paths if not has_magic(p)}
+    pyname = pyproject.name
+    if cfg is None:
+        return frozenset(p for p in changed if p != pyname and p not in version_files)
+    ignore = _compile_ignores(tuple(cfg.ignore.paths))
+    explicit = (*cfg.openapi.paths, *cfg.migrations.paths)
+    return frozenset(
+        p
+        for p in changed
+        if p != pyname
+        and p not in version_files
+        and (ignore is None or not ignore.match(os.path.normcase(p)) or _touches([p], explicit))
+    )
+
+
+def _version_paths(cfg: Config, args: argparse.Namespace) -> list[str]:
+    """Combine configured and command-line version file patterns."""
+
+    paths = list(cfg.version.paths)
+    if args.version_path:
+        paths.extend(args.version_path)
+    return paths
+
+
 def _prepare_version_files(
     cfg: Config,
     args: argparse.Namespace,
@@ -249,20 +349,41 @@ def _prepare_version_files(
         List of file patterns to update, or ``None`` when no bump is required.
     """
 
-    paths = list(cfg.version.paths)
-    if args.version_path:
-        paths.extend(args.version_path)
-    version_files = {p for p in paths if not has_magic(p)}
+    paths = _version_paths(cfg, args)
     changed = _safe_changed_paths(base, head)
-    if changed is not None:
-        filtered = {
-            p for p in changed if p != pyproject.name and p not in version_files
-        }
-        if not filtered:
-            return None
+    # An explicit level is honoured even when only ignored files changed.
+    scan_cfg = None if getattr(args, "level", None) else cfg
+    if changed is not None and not _relevant_changes(changed, pyproject, paths, scan_cfg):
+        return None
     return paths
 
 
+def _decide_changes(args: argparse.Namespace, cfg: Config, base: str) -> frozenset[str] | None:
+    """Return the changed paths ``bump --decide`` compares.
+
+    The relevance filter only decides whether anything needs comparing at
+    all; the unfiltered paths are returned otherwise, since Python modules
+    listed as version files may still change the public API.
+
+    Args:
+        args: Parsed command line arguments.
+        cfg: Project configuration object.
+        base: Git reference representing the comparison base.
+
+    Returns:
+        Changed paths, an empty set when nothing relevant changed, or ``None``
+        when git cannot diff the references.
+    """
+
+    changed = _safe_changed_paths(base, args.head)
+    if changed is None:
+        return None
+    version_files = [p for p in _version_paths(cfg, args) if not p.endswith(".py")]
+    if not _relevant_changes(changed, Path(args.pyproject), version_files, cfg):
+        return frozenset()
+    return changed
+
+
 def _display_result(
     args: argparse.Namespace, vc: VersionChange, decision: Decision
 ) -> None:
@@ -270,7 +391,7 @@ def _display_result(
 
     if args.format == "json":
         logger.info(
-            json.dumps(
+            _dump_json(
                 {
                     "old_version": vc.old,
                     "new_version": vc.new,
@@ -280,7 +401,6 @@ def _display_result(
                     "files": [str(p) for p in vc.files],
                     "skipped": [str(p) for p in vc.skipped],
                 },
-                indent=2,
             )
         )
     elif args.format == "md":
@@ -313,6 +433,26 @@ def _write_changelog(args: argparse.Namespace, changelog: str | None) -> None:
             fh.write(changelog)
 
 
+def _jobs_override(args: argparse.Namespace) -> int | None:
+    """Return the worker count requested outside the configuration file.
+
+    ``--jobs`` takes precedence over the ``BUMPWRIGHT_JOBS`` environment
+    variable. Invalid environment values are ignored with a warning.
+    """
+
+    jobs = getattr(args, "jobs", None)
+    if jobs is not None:
+        return jobs
+    env = os.environ.get(_JOBS_ENV, "").strip()
+    if not env:
+        return None
+    try:
+        return int(env)
+    except ValueError:
+        logger.warning("Ignoring %s=%r: expected an integer", _JOBS_ENV, env)
+        return None
+
+
 def bump_command(args: argparse.Namespace) -> int:
     """Apply a version bump based on repository changes.
 
@@ -374,10 +514,15 @@ def bump_command(args: argparse.Namespace) -> int:
             changelog_exclude (list[str]): Regex patterns of commit subjects to
                 exclude from changelog entries.
 
+            jobs (int | None): Worker processes used for source analysis.
+                ``0`` uses every CPU. Overrides ``BUMPWRIGHT_JOBS`` and
+                ``[performance].jobs``.
+
     Returns:
         Exit status code. ``0`` indicates success; ``1`` indicates an error.
     """
 
+    _reset_ref_caches()
     cfg: Config = load_config(args.config)
     if args.changelog is None and cfg.changelog.path:
         args.changelog = cfg.changelog.path
@@ -387,8 +532,12 @@ def bump_command(args: argparse.Namespace) -> int:
     cli_excludes = getattr(args, "changelog_exclude", []) or []
     excludes.extend(cli_excludes)
     args.changelog_exclude = excludes
+    jobs = _jobs_override(args)
+    if jobs is not None:
+        cfg.performance.jobs = jobs
     if args.decide:
-        return _decide_only(args, cfg)
+        base = args.base or last_release_commit() or "HEAD^"
+        return _decide_only(args, cfg, _decide_changes(args, cfg, base))
 
     level = args.level
     decision: Decision | None = None
@@ -405,7 +554,7 @@ def bump_command(args: argparse.Namespace) -> int:
         return 0
 
     if not level:
-        decision = _infer_level(base, head, cfg, args)
+        decision = _infer_level(base, head, cfg, args, _safe_changed_paths(base, head))
         if decision.level is None:
             logger.info("No version bump needed")
             return 0
@@ -439,5 +588,6 @@ def bump_command(args: argparse.Namespace) -> int:
     _display_result(args, vc, decision)
     if not args.dry_run:
         _commit_tag(vc.files, vc.new, args.commit, args.tag)
+        gitutils.last_release_commit.cache_clear()
     _write_changelog(args, changelog)
     return 0
@@ -5,14 +5,20 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 import subprocess
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import TypeVar
 
+from .. import cache
 from ..analysers import get_analyser_info
-from ..analysers.utils import parse_python_source
+from ..analysers.utils import map_sources, parse_python_source, resolve_jobs
 from ..compare import Decision, Impact, decide_bump, diff_public_api
 from ..config import Config
-from ..gitutils import last_release_commit, list_py_files_at_ref
+from ..gitutils import iter_files_at_ref, last_release_commit, list_py_files_with_sha
 from ..public_api import (
     PublicAPI,
     extract_public_api_from_source,
@@ -20,36 +26,233 @@ from ..public_api import (
 )
 from . import add_analyser_toggles, add_ref_options
 
+try:  # pragma: no cover - optional speed-up
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+_SEVERITY_LABELS = {"major": "MAJOR", "minor": "MINOR", "patch": "PATCH"}
+
+_T = TypeVar("_T")
+
+
+def _dump_json(payload: object) -> str:
+    """Serialise ``payload`` as two-space indented JSON.
+
+    Uses :mod:`orjson` when it is installed and falls back to :mod:`json`.
+    Both emit non-ASCII characters unescaped, so the output does not depend
+    on which one is available.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(payload, indent=2, ensure_ascii=False)
+
+
+def _extract_module(item: tuple[str, str, tuple[str, ...]]) -> PublicAPI | None:
+    """Extract the public API for one module inside a worker process.
+
+    Args:
+        item: Tuple of ``(module_name, source, private_prefixes)``.
+
+    Returns:
+        Public API of the module or ``None`` if the source is invalid.
+    """
+
+    modname, code, private_prefixes = item
+    try:
+        return extract_public_api_from_source(modname, code, private_prefixes)
+    except (SyntaxError, ValueError):
+        return None
 
-def _build_api_at_ref(
+
+# Public API of each module keyed by ``(blob_sha, module_name, private_prefixes)``.
+# Blob SHAs identify contents, so entries never go stale and modules that are
+# unchanged between references are neither read nor extracted twice.
+_API_BY_BLOB: dict[tuple[str, str, tuple[str, ...]], PublicAPI] = {}
+
+
+def _build_api_at_ref(  # noqa: PLR0913
     ref: str,
-    roots: list[str],
+    roots: Iterable[str],
     ignores: Iterable[str],
     private_prefixes: Iterable[str],
+    jobs: int = 1,
+    *,
+    cache_dir: Path | None = None,
+    only: Iterable[str] | None = None,
+) -> PublicAPI:
+    """Collect the public API for ``roots`` at a git reference.
+
+    Modules are identified by blob SHA from a single ``git ls-tree`` walk.
+    Only modules whose contents have not been seen before are read and
+    parsed, through the same cache the analysers use. When ``jobs`` allows
+    more than one worker, those modules are instead parsed and extracted in
+    a process pool. With ``cache_dir`` set, extracted APIs are also kept on
+    disk so later runs skip unchanged modules entirely. ``only`` restricts
+    the result to modules at those paths.
+
+    Results are memoised per working directory; callers must treat the
+    returned mapping as read-only.
+    """
+
+    return _build_api_cached(
+        ref,
+        tuple(roots),
+        tuple(ignores),
+        tuple(private_prefixes),
+        jobs=jobs,
+        cache_dir=cache_dir,
+        only=None if only is None else frozenset(only),
+        cwd=os.getcwd(),
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_api_cached(  # noqa: PLR0913
+    ref: str,
+    roots: tuple[str, ...],
+    ignores: tuple[str, ...],
+    prefixes: tuple[str, ...],
+    *,
+    jobs: int,
+    cache_dir: Path | None,
+    only: frozenset[str] | None,
+    cwd: str,  # only part of the cache key
 ) -> PublicAPI:
-    """Collect the public API for ``roots`` at a git reference."""
+    """Build the public API for :func:`_build_api_at_ref` once per key."""
 
     api: PublicAPI = {}
     for root in roots:
-        paths = sorted(list_py_files_at_ref(ref, [root], ignore_globs=ignores))
-        for path in paths:
-            tree = parse_python_source(ref, path)
-            if tree is None:
-                continue
-            modname = module_name_from_path(root, path)
-            api.update(extract_public_api_from_source(modname, tree, private_prefixes))
+        modules = [
+            (path, (sha, module_name_from_path(root, path), prefixes))
+            for path, sha in list_py_files_with_sha(ref, [root], ignore_globs=ignores)
+            if only is None or path in only
+        ]
+        missing = {path: key for path, key in modules if key not in _API_BY_BLOB}
+        if cache_dir is not None:
+            missing = _load_cached_apis(cache_dir, missing)
+        if missing:
+            if resolve_jobs(jobs) > 1:
+                _extract_parallel(ref, missing, jobs)
+            else:
+                _extract_serial(ref, missing)
+            if cache_dir is not None:
+                _store_cached_apis(cache_dir, missing)
+        for _path, key in modules:
+            module_api = _API_BY_BLOB.get(key)
+            if module_api is not None:
+                api.update(module_api)
     return api
 
 
+def clear_caches() -> None:
+    """Drop public APIs memoised per reference name.
+
+    Per-blob module APIs in ``_API_BY_BLOB`` are keyed by content and kept.
+    """
+
+    _build_api_cached.cache_clear()
+
+
+def _blob_cache_key(key: tuple[str, str, tuple[str, ...]]) -> str:
+    """Return the on-disk cache key for an ``_API_BY_BLOB`` entry."""
+
+    sha, modname, prefixes = key
+    return "\0".join((sha, modname, *prefixes))
+
+
+def _load_cached_apis(
+    cache_dir: Path, missing: dict[str, tuple[str, str, tuple[str, ...]]]
+) -> dict[str, tuple[str, str, tuple[str, ...]]]:
+    """Fill ``_API_BY_BLOB`` from disk and return modules still missing."""
+
+    remaining: dict[str, tuple[str, str, tuple[str, ...]]] = {}
+    for path, key in missing.items():
+        module_api = cache.load(cache_dir, "api", _blob_cache_key(key))
+        if module_api is None:
+            remaining[path] = key
+        else:
+            _API_BY_BLOB[key] = module_api
+    return remaining
+
+
+def _store_cached_apis(cache_dir: Path, extracted: dict[str, tuple[str, str, tuple[str, ...]]]) -> None:
+    """Persist freshly extracted module APIs to ``cache_dir``."""
+
+    for key in extracted.values():
+        module_api = _API_BY_BLOB.get(key)
+        if module_api is not None:
+            cache.store(cache_dir, "api", _blob_cache_key(key), module_api)
+
+
+def _extract_serial(
+    ref: str,
+    missing: dict[str, tuple[str, str, tuple[str, ...]]],
+    cwd: str | None = None,
+) -> None:
+    """Parse and extract ``missing`` modules at ``ref`` in this process.
+
+    Trees come from :func:`parse_python_source` with the same ``cwd`` the
+    analysers use, so both share each parsed module.
+    """
+
+    for path, _code in iter_files_at_ref(ref, missing, cwd):
+        tree = parse_python_source(ref, path, cwd)
+        if tree is None:
+            continue
+        _sha, modname, prefixes = key = missing[path]
+        _API_BY_BLOB[key] = extract_public_api_from_source(modname, tree, prefixes)
+
+
+def _extract_parallel(
+    ref: str,
+    missing: dict[str, tuple[str, str, tuple[str, ...]]],
+    jobs: int,
+) -> None:
+    """Parse and extract ``missing`` modules at ``ref`` using worker processes."""
+
+    paths: list[str] = []
+    batch: list[tuple[str, str, tuple[str, ...]]] = []
+    for path, code in iter_files_at_ref(ref, missing):
+        if code is None:
+            continue
+        _sha, modname, prefixes = missing[path]
+        paths.append(path)
+        batch.append((modname, code, prefixes))
+
+    for path, result in zip(paths, map_sources(_extract_module, batch, jobs)):
+        if result is None:
+            logger.warning("Failed to parse %s at %s", path, ref)
+            continue
+        _API_BY_BLOB[missing[path]] = result
+
+
+def _for_refs(func: Callable[[str], _T], base: str, head: str, jobs: int) -> tuple[_T, _T]:
+    """Return ``(func(base), func(head))``.
+
+    When ``jobs`` allows parallel work the head reference is handled in a
+    helper thread while this thread handles the base, overlapping git I/O
+    for one reference with parsing for the other.
+    """
+
+    if resolve_jobs(jobs) <= 1:
+        return func(base), func(head)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        new = pool.submit(func, head)
+        return func(base), new.result()
+
+
 def _format_impacts_text(impacts: list[Impact]) -> str:
     """Render a list of impacts as human-readable text."""
 
-    lines = []
-    for i in impacts:
-        lines.append(f"- [{i.severity.upper()}] {i.symbol}: {i.reason}")
-    return "\n".join(lines) if lines else "(no API-impacting changes detected)"
+    if not impacts:
+        return "(no API-impacting changes detected)"
+    return "\n".join(
+        f"- [{_SEVERITY_LABELS.get(i.severity) or i.severity.upper()}] {i.symbol}: {i.reason}" for i in impacts
+    )
 
 
 def add_decide_arguments(parser: argparse.ArgumentParser) -> None:
@@ -69,20 +272,49 @@ def add_decide_arguments(parser: argparse.ArgumentParser) -> None:
     add_analyser_toggles(parser)
 
 
-def _run_analysers(
+def _touches(changed: Iterable[str], roots: Iterable[str], suffixes: tuple[str, ...] = ()) -> bool:
+    """Return whether any changed path lies within ``roots``.
+
+    Args:
+        changed: Paths changed between two references.
+        roots: Directories or files to test against. ``"."`` matches
+            everything.
+        suffixes: File extensions to consider; empty means any file.
+
+    Returns:
+        ``True`` if a changed path with a matching suffix equals or falls
+        under one of ``roots``.
+    """
+
+    norm = {str(Path(r)) for r in roots}
+    if suffixes:
+        changed = [path for path in changed if path.endswith(suffixes)]
+    if "." in norm:
+        return bool(changed) if suffixes else True
+    prefixes = tuple(f"{r}/" for r in norm)
+    return any(path in norm or path.startswith(prefixes) for path in changed)
+
+
+def _run_analysers(  # noqa: PLR0913
     base: str,
     head: str,
     cfg: Config,
     enable: Iterable[str] | None = None,
     disable: Iterable[str] | None = None,
+    *,
+    changed: Iterable[str] | None = None,
 ) -> list[Impact]:
-    """Run analyser plugins and collect impacts."""
+    """Run analyser plugins and collect impacts.
 
-    names = set(cfg.analysers.enabled)
-    if enable:
-        names.update(enable)
-    if disable:
-        names.difference_update(disable)
+    Analysers declaring ``watched_paths()`` are skipped when ``changed`` is
+    known and none of those paths were touched by a file ending in one of
+    the analyser's ``watched_suffixes``.
+    """
+
+    # Configured analysers run in name order, followed by extra ones enabled on
+    # the command line, so impacts are reported in a reproducible order.
+    disabled = set(disable or ())
+    names = [name for name in dict.fromkeys([*sorted(cfg.analysers.enabled), *(enable or ())]) if name not in disabled]
 
     impacts: list[Impact] = []
     for name in names:
@@ -91,8 +323,11 @@ def _run_analysers(
             logger.warning("Analyser '%s' is not registered", name)
             continue
         analyser = info.cls(cfg)
-        old = analyser.collect(base)
-        new = analyser.collect(head)
+        watched = getattr(analyser, "watched_paths", None)
+        suffixes = getattr(analyser, "watched_suffixes", ())
+        if changed is not None and watched is not None and not _touches(changed, watched(), suffixes):
+            continue
+        old, new = _for_refs(analyser.collect, base, head, cfg.performance.jobs)
         impacts.extend(analyser.compare(old, new))
     return impacts
 
@@ -112,41 +347,32 @@ def _infer_base_ref() -> str:
         return "origin/HEAD"
 
 
-def _decide_only(args: argparse.Namespace, cfg: Config) -> int:
-    """Handle ``bump --decide`` mode."""
+def _decide_only(
+    args: argparse.Namespace,
+    cfg: Config,
+    changed: frozenset[str] | None = None,
+) -> int:
+    """Handle ``bump --decide`` mode.
+
+    When ``changed`` is an empty set, nothing relevant changed and no
+    source is parsed at all.
+    """
 
     base = args.base or last_release_commit() or "HEAD^"
     head = args.head
-    old_api = _build_api_at_ref(
-        base,
-        cfg.project.public_roots,
-        cfg.ignore.paths,
-        cfg.project.private_prefixes,
-    )
-    new_api = _build_api_at_ref(
-        head,
-        cfg.project.public_roots,
-        cfg.ignore.paths,
-        cfg.project.private_prefixes,
-    )
-    impacts = diff_public_api(
-        old_api,
-        new_api,
-        return_type_change=cfg.rules.return_type_change,
-        param_annotation_change=cfg.rules.param_annotation_change,
-    )
-    impacts.extend(_run_analysers(base, head, cfg, args.enable_analyser, args.disable_analyser))
+    impacts: list[Impact] = []
+    if changed is None or changed:
+        impacts = _collect_impacts(base, head, cfg, args, changed)
     decision = decide_bump(impacts)
     if args.format == "json":
         logger.info(
-            json.dumps(
+            _dump_json(
                 {
                     "level": decision.level,
                     "confidence": decision.confidence,
                     "reasons": decision.reasons,
-                    "impacts": [i.__dict__ for i in impacts],
+                    "impacts": [{"severity": i.severity, "symbol": i.symbol, "reason": i.reason} for i in impacts],
                 },
-                indent=2,
             )
         )
     elif args.format == "md":
@@ -158,25 +384,53 @@ def _decide_only(args: argparse.Namespace, cfg: Config) -> int:
     return 0
 
 
-def _infer_level(
+def _changed_modules(changed: frozenset[str] | None) -> frozenset[str] | None:
+    """Return the Python files among ``changed`` paths.
+
+    Args:
+        changed: Paths differing between the compared references, or ``None``
+            when they are unknown.
+
+    Returns:
+        Changed ``.py`` paths, or ``None`` when every module has to be
+        compared.
+    """
+
+    if changed is None:
+        return None
+    return frozenset(path for path in changed if path.endswith(".py"))
+
+
+def _collect_impacts(
     base: str,
     head: str,
     cfg: Config,
     args: argparse.Namespace,
-) -> Decision:
-    """Compute bump level from repository differences."""
+    changed: frozenset[str] | None = None,
+) -> list[Impact]:
+    """Diff public APIs and run analysers between two references.
+
+    Impacts are keyed by module, so modules identical at both references
+    cannot contribute any. Only modules among the ``changed`` paths are
+    extracted; when ``changed`` is ``None`` every module is compared.
+    With more than one job the two references are collected concurrently.
+    """
 
-    old_api = _build_api_at_ref(
+    cache_dir = cache.cache_root() if cfg.performance.cache else None
+    only = _changed_modules(changed)
+    old_api, new_api = _for_refs(
+        lambda ref: _build_api_at_ref(
+            ref,
+            cfg.project.public_roots,
+            cfg.ignore.paths,
+            cfg.project.private_prefixes,
+            cfg.performance.jobs,
+            cache_dir=cache_dir,
+            only=only,
+        ),
         base,
-        cfg.project.public_roots,
-        cfg.ignore.paths,
-        cfg.project.private_prefixes,
-    )
-    new_api = _build_api_at_ref(
         head,
-        cfg.project.public_roots,
-        cfg.ignore.paths,
-        cfg.project.private_prefixes,
+        cfg.performance.jobs,
     )
     impacts = diff_public_api(
         old_api,
@@ -184,5 +438,26 @@ def _infer_level(
         return_type_change=cfg.rules.return_type_change,
         param_annotation_change=cfg.rules.param_annotation_change,
     )
-    impacts.extend(_run_analysers(base, head, cfg, args.enable_analyser, args.disable_analyser))
-    return decide_bump(impacts)
+    impacts.extend(
+        _run_analysers(
+            base,
+            head,
+            cfg,
+            args.enable_analyser,
+            args.disable_analyser,
+            changed=changed,
+        )
+    )
+    return impacts
+
+
+def _infer_level(
+    base: str,
+    head: str,
+    cfg: Config,
+    args: argparse.Namespace,
+    changed: frozenset[str] | None = None,
+) -> Decision:
+    """Compute bump level from repository differences."""
+
+    return decide_bump(_collect_impacts(base, head, cfg, args, changed))
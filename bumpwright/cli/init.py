@@ -27,6 +27,7 @@ def init_command(_args: argparse.Namespace) -> int:
         already present, while ``1`` indicates an error.
     """
 
+    last_release_commit.cache_clear()
     if last_release_commit() is not None:
         logger.info("Baseline already initialised.")
         return 0
@@ -41,5 +42,6 @@ def init_command(_args: argparse.Namespace) -> int:
         ],
         check=True,
     )
+    last_release_commit.cache_clear()
     logger.info("Created baseline release commit.")
     return 0
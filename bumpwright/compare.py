@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
 
 from .public_api import FuncSig, Param, PublicAPI
@@ -11,8 +11,13 @@ from .types import BumpLevel
 # Severity levels for public API changes
 Severity = BumpLevel
 
+# Parameter kinds that callers must supply unless a default is given.
+_REQUIRED_KINDS = frozenset({"posonly", "pos", "kwonly"})
+# Parameter kinds whose removal only affects callers that opted into them.
+_OPTIONAL_KINDS = frozenset({"kwonly", "vararg", "varkw"})
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Impact:
     """Describe a change in the public API.
 
@@ -27,7 +32,7 @@ class Impact:
     reason: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Decision:
     """Describe the outcome of a bump decision.
 
@@ -72,9 +77,9 @@ def _removed_params(oldp: dict[str, Param], newp: dict[str, Param], fullname: st
     impacts: list[Impact] = []
     for name, op in oldp.items():
         if name not in newp:
-            if op.kind in ("posonly", "pos", "kwonly") and op.default is None:
+            if op.kind in _REQUIRED_KINDS and op.default is None:
                 impacts.append(Impact("major", fullname, f"Removed required param '{name}'"))
-            elif op.default is not None or op.kind in ("kwonly", "vararg", "varkw"):
+            elif op.default is not None or op.kind in _OPTIONAL_KINDS:
                 impacts.append(Impact("minor", fullname, f"Removed optional param '{name}'"))
     return impacts
 
@@ -94,7 +99,7 @@ def _added_params(oldp: dict[str, Param], newp: dict[str, Param], fullname: str)
     impacts: list[Impact] = []
     for name, np in newp.items():
         if name not in oldp:
-            if np.default is None and np.kind in ("posonly", "pos", "kwonly"):
+            if np.default is None and np.kind in _REQUIRED_KINDS:
                 impacts.append(Impact("major", fullname, f"Added required param '{name}'"))
             else:
                 impacts.append(Impact("minor", fullname, f"Added optional param '{name}'"))
@@ -117,7 +122,7 @@ def _param_kind_changes(oldp: dict[str, Param], newp: dict[str, Param], fullname
     for name, np in newp.items():
         if name in oldp:
             op = oldp[name]
-            if op.kind != np.kind and (op.kind in ("posonly", "pos", "kwonly") or np.kind in ("posonly", "pos", "kwonly")):
+            if op.kind != np.kind and (op.kind in _REQUIRED_KINDS or np.kind in _REQUIRED_KINDS):
                 impacts.append(
                     Impact(
                         "major",
@@ -259,34 +264,31 @@ def diff_public_api(
         param_annotation_change: Severity level for parameter annotation changes.
 
     Returns:
-        List of detected impacts.
+        List of detected impacts: removed symbols first, then changed
+        signatures, then added symbols, each in mapping order.
     """
 
-    impacts: list[Impact] = []
-
-    # Removed symbols
-    for k in old.keys() - new.keys():
-        impacts.append(Impact("major", k, "Removed public symbol"))
-
-    # Surviving symbols
-    for k in old.keys() & new.keys():
-        impacts.extend(
-            compare_funcs(
-                old[k],
-                new[k],
-                return_type_change=return_type_change,
-                param_annotation_change=param_annotation_change,
+    removed: list[Impact] = []
+    changed: list[Impact] = []
+    for k, old_sig in old.items():
+        new_sig = new.get(k)
+        if new_sig is None:
+            removed.append(Impact("major", k, "Removed public symbol"))
+        elif new_sig != old_sig:
+            # Identical signatures cannot produce impacts, so skip indexing them.
+            changed.extend(
+                compare_funcs(
+                    old_sig,
+                    new_sig,
+                    return_type_change=return_type_change,
+                    param_annotation_change=param_annotation_change,
+                )
             )
-        )
-
-    # Added symbols
-    for k in new.keys() - old.keys():
-        impacts.append(Impact("minor", k, "Added public symbol"))
-
-    return impacts
+    added = [Impact("minor", k, "Added public symbol") for k in new if k not in old]
+    return removed + changed + added
 
 
-def decide_bump(impacts: list[Impact]) -> Decision:
+def decide_bump(impacts: Iterable[Impact]) -> Decision:
     """Determine the bump level from a list of impacts.
 
     Args:
@@ -296,18 +298,14 @@ def decide_bump(impacts: list[Impact]) -> Decision:
         Decision detailing the suggested bump level, confidence and reasons.
     """
 
-    if not impacts:
+    reasons_by_level: dict[Severity, list[str]] = {"major": [], "minor": [], "patch": []}
+    total = 0
+    for impact in impacts:
+        reasons_by_level.setdefault(impact.severity, []).append(impact.reason)
+        total += 1
+    if not total:
         return Decision(None, 0.0, [])
 
-    counts: Counter[Severity] = Counter(i.severity for i in impacts)
-    total = sum(counts.values())
-    if counts.get("major"):
-        level: Severity = "major"
-    elif counts.get("minor"):
-        level = "minor"
-    else:
-        level = "patch"
-    level_count = counts.get(level, 0)
-    reasons = [i.reason for i in impacts if i.severity == level]
-    confidence = level_count / total if total else 0.0
-    return Decision(level, confidence, reasons)
+    level: Severity = "major" if reasons_by_level["major"] else "minor" if reasons_by_level["minor"] else "patch"
+    reasons = reasons_by_level[level]
+    return Decision(level, len(reasons) / total, reasons)
@@ -6,8 +6,8 @@ try:  # pragma: no cover - exercised in Python <3.11 tests
     import tomllib
 except ModuleNotFoundError:  # pragma: no cover
     import tomli as tomllib
-import copy
 from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from .types import BumpLevel
@@ -100,6 +100,23 @@ class OpenAPI:
     )
 
 
+@dataclass
+class Performance:
+    """Settings controlling how analysis work is scheduled.
+
+    Attributes:
+        jobs: Number of worker processes used to extract APIs and routes.
+            ``1`` runs serially and ``0`` uses every available CPU. Hosts
+            with two or fewer CPUs always run serially.
+        cache: Persist extracted public APIs under the repository's git
+            directory, keyed by blob SHA, so unchanged modules are not
+            re-parsed on later runs.
+    """
+
+    jobs: int = 1
+    cache: bool = True
+
+
 @dataclass
 class Changelog:
     """Changelog file configuration.
@@ -164,6 +181,7 @@ class Config:
         analysers: Optional analyser plugin settings.
         changelog: Changelog file path and template defaults.
         version: Locations containing version strings.
+        performance: Worker settings for source analysis.
     """
 
     project: Project = field(default_factory=Project)
@@ -174,6 +192,26 @@ class Config:
     openapi: OpenAPI = field(default_factory=OpenAPI)
     changelog: Changelog = field(default_factory=Changelog)
     version: VersionFiles = field(default_factory=VersionFiles)
+    performance: Performance = field(default_factory=Performance)
+
+
+def _clone_defaults(defaults: dict) -> dict:
+    """Copy a defaults mapping so callers may mutate the result.
+
+    Sections are flat mappings whose values are scalars, lists or sets, so
+    rebuilding those containers is enough to avoid sharing any state.
+
+    Args:
+        defaults: Default configuration mapping generated from dataclasses.
+
+    Returns:
+        Independent copy of ``defaults``.
+    """
+
+    return {
+        section: {key: type(value)(value) if isinstance(value, (list, set)) else value for key, value in content.items()}
+        for section, content in defaults.items()
+    }
 
 
 def _merge_defaults(data: dict | None, defaults: dict) -> dict:
@@ -187,7 +225,7 @@ def _merge_defaults(data: dict | None, defaults: dict) -> dict:
         Combined configuration with defaults applied.
     """
 
-    out = copy.deepcopy(defaults)  # Avoid mutating the defaults mapping
+    out = _clone_defaults(defaults)
     for section, content in (data or {}).items():
         out.setdefault(section, {}).update(content or {})
     return out
@@ -217,6 +255,16 @@ def _validate_keys(data: dict, defaults: dict) -> None:
             raise ValueError(f"Unknown keys in '{section}' section: {unknown}")
 
 
+@lru_cache(maxsize=1)
+def _defaults() -> dict:
+    """Return the default configuration mapping.
+
+    The result is shared between calls and must not be mutated.
+    """
+
+    return asdict(Config())
+
+
 def load_config(path: str | Path = "bumpwright.toml") -> Config:
     """Load configuration from a TOML file.
 
@@ -231,8 +279,9 @@ def load_config(path: str | Path = "bumpwright.toml") -> Config:
     if not p.exists():
         raw = {}
     else:
-        raw = tomllib.loads(p.read_text(encoding="utf-8"))
-    defaults = asdict(Config())
+        with p.open("rb") as fh:
+            raw = tomllib.load(fh)
+    defaults = _defaults()
     user_ignore = raw.get("version", {}).get("ignore")
     if user_ignore:
         raw.setdefault("version", {})["ignore"] = [
@@ -250,6 +299,7 @@ def load_config(path: str | Path = "bumpwright.toml") -> Config:
     openapi = OpenAPI(**d.get("openapi", {}))
     changelog = Changelog(**d.get("changelog", {}))
     version = VersionFiles(**d.get("version", {}))
+    performance = Performance(**d.get("performance", {}))
     return Config(
         project=proj,
         rules=rules,
@@ -259,4 +309,5 @@ def load_config(path: str | Path = "bumpwright.toml") -> Config:
         openapi=openapi,
         changelog=changelog,
         version=version,
+        performance=performance,
     )
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import atexit
+import os
 import re
 import subprocess
-from collections.abc import Iterable
-from fnmatch import fnmatch
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager, suppress
+from fnmatch import translate
 from functools import lru_cache
-from io import BytesIO
 from pathlib import Path
+from types import TracebackType
+from typing import NoReturn
 
 
 def _run(cmd: list[str], cwd: str | None = None) -> str:
@@ -39,6 +44,9 @@ def _run(cmd: list[str], cwd: str | None = None) -> str:
 def changed_paths(base: str, head: str, cwd: str | None = None) -> set[str]:
     """Return paths changed between two git references.
 
+    Rename detection is disabled, so a moved file reports both its old and
+    new path and git skips the costly similarity search on large diffs.
+
     Args:
         base: Base git reference.
         head: Head git reference.
@@ -48,18 +56,38 @@ def changed_paths(base: str, head: str, cwd: str | None = None) -> set[str]:
         Set of file paths that differ between the two refs.
     """
 
-    out = _run(["git", "diff", "--name-only", f"{base}..{head}"], cwd)
+    out = _run(["git", "diff", "--name-only", "--no-renames", f"{base}..{head}"], cwd)
     return {line.strip() for line in out.splitlines() if line.strip()}
 
 
+@lru_cache(maxsize=64)
+def _compile_ignores(globs: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile ignore globs into a single anchored regular expression.
+
+    Matching a path against the result is equivalent to calling
+    :func:`fnmatch.fnmatch` with each glob, without re-evaluating every
+    pattern per file.
+
+    Args:
+        globs: Glob patterns to combine.
+
+    Returns:
+        Compiled pattern, or ``None`` when ``globs`` is empty.
+    """
+
+    if not globs:
+        return None
+    return re.compile("|".join(translate(os.path.normcase(g)) for g in globs))
+
+
 @lru_cache(maxsize=None)
-def _list_py_files_at_ref_cached(
+def _list_py_blobs_at_ref_cached(
     ref: str,
     roots: tuple[str, ...],
     ignore_globs: tuple[str, ...],
     cwd: str | None,
-) -> frozenset[str]:
-    """Return cached Python file paths for a given ref.
+) -> tuple[tuple[str, str], ...]:
+    """Return cached Python file paths and blob SHAs for a given ref.
 
     Args:
         ref: Git reference to inspect.
@@ -68,24 +96,78 @@ def _list_py_files_at_ref_cached(
         cwd: Repository path.
 
     Returns:
-        Frozen set of matching Python file paths.
+        Tuple of ``(path, blob_sha)`` pairs sorted by path. ``git ls-tree``
+        already emits paths in byte order, so no extra sort is needed.
     """
 
-    out = _run(["git", "ls-tree", "-r", "--name-only", ref], cwd)
-    paths: set[str] = set()
+    out = _run(["git", "ls-tree", "-r", ref], cwd)
+    entries: list[tuple[str, str]] = []
     roots_norm = [str(Path(r)) for r in roots]
+    ignore = _compile_ignores(ignore_globs)
     for line in out.splitlines():
-        if not line.endswith(".py"):
+        meta, _, name = line.partition("\t")
+        if not name.endswith(".py"):
             continue
-        p = Path(line)
+        _mode, typ, sha = meta.split()
+        if typ != "blob":
+            continue
+        p = Path(name)
         if any(
             str(p).startswith(r.rstrip("/") + "/") or str(p) == r for r in roots_norm
         ):
             s = str(p)
-            if ignore_globs and any(fnmatch(s, pat) for pat in ignore_globs):
+            if ignore is not None and ignore.match(os.path.normcase(s)):
                 continue
-            paths.add(s)
-    return frozenset(paths)
+            entries.append((s, sha))
+    return tuple(entries)
+
+
+@lru_cache(maxsize=None)
+def _list_py_files_at_ref_cached(
+    ref: str,
+    roots: tuple[str, ...],
+    ignore_globs: tuple[str, ...],
+    cwd: str | None,
+) -> frozenset[str]:
+    """Return cached Python file paths for a given ref.
+
+    Args:
+        ref: Git reference to inspect.
+        roots: Root directories to include.
+        ignore_globs: Glob patterns to exclude.
+        cwd: Repository path.
+
+    Returns:
+        Frozen set of matching Python file paths.
+    """
+
+    blobs = _list_py_blobs_at_ref_cached(ref, roots, ignore_globs, cwd)
+    return frozenset(path for path, _sha in blobs)
+
+
+def list_py_files_with_sha(
+    ref: str,
+    roots: Iterable[str],
+    ignore_globs: Iterable[str] | None = None,
+    cwd: str | None = None,
+) -> list[tuple[str, str]]:
+    """List Python files under given roots at a git ref with their blob SHAs.
+
+    Blob SHAs identify file contents, so callers can reuse work for files
+    that are unchanged between references without reading them. Shares the
+    cached ``git ls-tree`` walk with :func:`list_py_files_at_ref`.
+
+    Args:
+        ref: Git reference to inspect.
+        roots: Root directories to include.
+        ignore_globs: Optional glob patterns to exclude.
+        cwd: Repository path.
+
+    Returns:
+        List of ``(path, blob_sha)`` pairs sorted by path.
+    """
+
+    return list(_list_py_blobs_at_ref_cached(ref, tuple(roots), tuple(ignore_globs or ()), cwd))
 
 
 def list_py_files_at_ref(
@@ -97,7 +179,7 @@ def list_py_files_at_ref(
     """List Python files under given roots at a git ref.
 
     Results are cached per ``(ref, tuple(roots), tuple(ignores))`` for improved
-    performance. Use ``list_py_files_at_ref.cache_clear()`` to invalidate.
+    performance. Use :func:`clear_caches` to invalidate.
 
     Args:
         ref: Git reference to inspect.
@@ -114,15 +196,285 @@ def list_py_files_at_ref(
     return set(_list_py_files_at_ref_cached(ref, roots_tuple, ignores_tuple, cwd))
 
 
-list_py_files_at_ref.cache_clear = _list_py_files_at_ref_cached.cache_clear  # type: ignore[attr-defined]
+class BatchCatFile:
+    """Read blobs through one ``git cat-file --batch`` process.
+
+    The process is started on entry and fed one ``ref:path`` request per
+    file, so reading many files costs a single git start-up. The reference
+    given here is the default; each read may name another, letting one
+    process serve both sides of a comparison.
+
+    Example:
+        >>> with BatchCatFile("HEAD") as bcf:  # doctest: +SKIP
+        ...     code = bcf.read("pkg/__init__.py")
+        ...     old = bcf.read("pkg/__init__.py", ref="v1.0.0")
+
+    Args:
+        ref: Default git reference at which to read files.
+        cwd: Repository path.
+    """
+
+    def __init__(self, ref: str | None = None, cwd: str | None = None) -> None:
+        self.ref = ref
+        self.cwd = cwd
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._busy = False
+
+    def __enter__(self) -> BatchCatFile:
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=self.cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the git process is running and can accept requests."""
+
+        return self._proc is not None and self._proc.poll() is None
+
+    def close(self) -> None:
+        """Stop the git process; further reads raise :class:`RuntimeError`."""
+
+        proc = self._proc
+        if proc is None:
+            return
+        self._proc = None
+        with suppress(BrokenPipeError):
+            proc.stdin.close()  # type: ignore[union-attr]
+        proc.stdout.close()  # type: ignore[union-attr]
+        proc.stderr.close()  # type: ignore[union-attr]
+        proc.wait()
+
+    def _spec(self, path: str, ref: str | None) -> str:
+        """Return the ``ref:path`` request line for ``path``."""
+
+        ref = ref or self.ref
+        if ref is None:
+            raise ValueError("a git reference is required")
+        return f"{ref}:{path}\n"
+
+    def _require(self) -> subprocess.Popen[bytes]:
+        """Return the running process, rejecting overlapping reads."""
+
+        proc = self._proc
+        if proc is None:
+            raise RuntimeError("BatchCatFile must be used as a context manager")
+        if self._busy:
+            raise RuntimeError("BatchCatFile is already serving another read")
+        return proc
+
+    def read_many(
+        self, paths: Iterable[str], ref: str | None = None
+    ) -> Iterator[tuple[str, str | None]]:
+        """Yield ``(path, contents)`` for ``paths`` as git produces them.
+
+        Requests are written from a helper thread so git never waits on a
+        round trip per file, while results are consumed as they arrive. If
+        the caller stops early the outstanding responses are drained, so the
+        process stays usable for later reads.
+
+        Args:
+            paths: File paths relative to the repository root.
+            ref: Reference to read at instead of the default.
+
+        Yields:
+            Tuples of path and contents, or ``None`` for missing files, in
+            request order.
+
+        Raises:
+            RuntimeError: If called outside the ``with`` block or while
+                another read is in progress.
+            ValueError: If neither ``ref`` nor a default reference is set.
+            subprocess.CalledProcessError: If the git process exits early.
+        """
+
+        proc = self._require()
+        paths = list(paths)
+        request = "".join(self._spec(path, ref) for path in paths).encode()
+
+        def _write() -> None:
+            with suppress(BrokenPipeError, ValueError):
+                proc.stdin.write(request)  # type: ignore[union-attr]
+                proc.stdin.flush()  # type: ignore[union-attr]
+
+        self._busy = True
+        writer = threading.Thread(target=_write, daemon=True)
+        writer.start()
+        remaining = len(paths)
+        try:
+            for path in paths:
+                content = self._read_response(proc)
+                remaining -= 1
+                yield path, content
+        finally:
+            if remaining and proc.poll() is None:
+                with suppress(subprocess.CalledProcessError, ValueError):
+                    for _ in range(remaining):
+                        self._read_response(proc)
+            writer.join()
+            self._busy = False
+
+    def read(self, path: str, ref: str | None = None) -> str | None:
+        """Return the contents of ``path`` at the batch reference.
+
+        Args:
+            path: File path relative to the repository root.
+            ref: Reference to read at instead of the default.
+
+        Returns:
+            File contents, or ``None`` if the file does not exist at the
+            reference.
+
+        Raises:
+            RuntimeError: If called outside the ``with`` block or while
+                another read is in progress.
+            ValueError: If neither ``ref`` nor a default reference is set.
+            subprocess.CalledProcessError: If the git process exits early.
+        """
+
+        proc = self._require()
+        stdin = proc.stdin
+        try:
+            stdin.write(self._spec(path, ref).encode())  # type: ignore[union-attr]
+            stdin.flush()  # type: ignore[union-attr]
+        except BrokenPipeError:
+            self._fail(proc)
+        return self._read_response(proc)
+
+    @classmethod
+    def _read_response(cls, proc: subprocess.Popen[bytes]) -> str | None:
+        """Read one framed ``cat-file`` response from ``proc``."""
+
+        stdout = proc.stdout
+        header = stdout.readline()  # type: ignore[union-attr]
+        if not header:
+            cls._fail(proc)
+        if header.endswith((b" missing\n", b" ambiguous\n")):
+            return None
+        size = int(header.rsplit(None, 1)[1])
+        data = stdout.read(size + 1)  # type: ignore[union-attr]
+        return data[:size].decode()
+
+    @staticmethod
+    def _fail(proc: subprocess.Popen[bytes]) -> NoReturn:
+        """Raise an error describing an unexpected git exit."""
+
+        returncode = proc.wait()
+        stderr = proc.stderr.read().decode()  # type: ignore[union-attr]
+        raise subprocess.CalledProcessError(returncode or 1, "git cat-file --batch", stderr=stderr)
+
+
+# Upper bound on idle shared processes, one per repository.
+_MAX_SHARED_CAT_FILES = 4
+# Long-lived batch processes keyed by repository path, least recently used first.
+_SHARED_CAT_FILES: dict[str, tuple[int, BatchCatFile]] = {}
+# Repository paths whose shared process is currently handed out.
+_LEASED_CAT_FILES: set[str] = set()
+_SHARED_CAT_FILES_LOCK = threading.Lock()
+
+
+def close_shared_cat_files() -> None:
+    """Stop every shared ``git cat-file`` process started by this module."""
+
+    pid = os.getpid()
+    with _SHARED_CAT_FILES_LOCK:
+        while _SHARED_CAT_FILES:
+            _key, (owner, bcf) = _SHARED_CAT_FILES.popitem()
+            if owner == pid:
+                bcf.close()
+
+
+atexit.register(close_shared_cat_files)
+
+
+def _claim_shared_cat_file(key: str) -> BatchCatFile:
+    """Return the shared process for ``key``, starting one if needed.
+
+    Must be called with ``_SHARED_CAT_FILES_LOCK`` held.
+    """
+
+    pid = os.getpid()
+    owner, bcf = _SHARED_CAT_FILES.pop(key, (pid, None))
+    if bcf is not None and (owner != pid or not bcf.alive):
+        if owner == pid:
+            bcf.close()
+        bcf = None
+    if bcf is None:
+        idle = [k for k in _SHARED_CAT_FILES if k not in _LEASED_CAT_FILES]
+        for old_key in idle[: max(0, len(_SHARED_CAT_FILES) + 1 - _MAX_SHARED_CAT_FILES)]:
+            old_owner, old = _SHARED_CAT_FILES.pop(old_key)
+            if old_owner == pid:
+                old.close()
+        bcf = BatchCatFile(cwd=key).__enter__()
+    _SHARED_CAT_FILES[key] = (pid, bcf)
+    return bcf
+
+
+@contextmanager
+def _cat_file(cwd: str | None) -> Iterator[BatchCatFile]:
+    """Provide a batch reader for ``cwd``, reusing a shared process if idle.
+
+    Every reference in a repository is served by the same process, so the
+    base and head sides of a command pay for one git start-up. While the
+    shared process is handed out, to another thread or to an unfinished
+    read in this one, callers get a short-lived process instead.
+    """
+
+    key = os.path.abspath(cwd or os.getcwd())
+    with _SHARED_CAT_FILES_LOCK:
+        shared = None if key in _LEASED_CAT_FILES else _claim_shared_cat_file(key)
+        if shared is not None:
+            _LEASED_CAT_FILES.add(key)
+    if shared is None:
+        with BatchCatFile(cwd=key) as private:
+            yield private
+        return
+    try:
+        yield shared
+    finally:
+        with _SHARED_CAT_FILES_LOCK:
+            _LEASED_CAT_FILES.discard(key)
+
+
+# Contents fetched by any batched read, keyed by ``(ref, cwd)`` and then path.
+# Lets single-file reads reuse a previous batch instead of spawning git again.
+# Only the most recently used references are kept.
+_MAX_BLOB_STORE_REFS = 8
+_BLOB_STORE: dict[tuple[str, str | None], dict[str, str | None]] = {}
+_BLOB_STORE_LOCK = threading.Lock()
+
+
+def _blob_store(ref: str, cwd: str | None) -> dict[str, str | None]:
+    """Return the content store for ``ref``, evicting the oldest beyond the cap."""
+
+    key = (ref, cwd)
+    with _BLOB_STORE_LOCK:
+        store = _BLOB_STORE.get(key)
+        if store is None:
+            while len(_BLOB_STORE) >= _MAX_BLOB_STORE_REFS:
+                _BLOB_STORE.pop(next(iter(_BLOB_STORE)))
+            store = _BLOB_STORE[key] = {}
+        return store
 
 
 def read_file_at_ref(ref: str, path: str, cwd: str | None = None) -> str | None:
     """Read the contents of ``path`` at ``ref`` if it exists.
 
     This is a thin wrapper around :func:`read_files_at_ref` that retrieves a
-    single file. Results are cached via ``read_files_at_ref``; call
-    ``read_file_at_ref.cache_clear()`` to invalidate.
+    single file. Files already fetched by an earlier batched read are served
+    without invoking git. Call :func:`clear_caches` to invalidate.
 
     Args:
         ref: Git reference at which to read the file.
@@ -133,6 +485,9 @@ def read_file_at_ref(ref: str, path: str, cwd: str | None = None) -> str | None:
         File contents, or ``None`` if the file does not exist at ``ref``.
     """
 
+    store = _BLOB_STORE.get((ref, cwd))
+    if store is not None and path in store:
+        return store[path]
     return read_files_at_ref(ref, [path], cwd).get(path)
 
 
@@ -154,48 +509,19 @@ def _read_files_at_ref_cached(
 
     if not paths:
         return {}
-    spec = "\n".join(f"{ref}:{p}" for p in paths) + "\n"
-    res = subprocess.run(
-        ["git", "cat-file", "--batch"],
-        cwd=cwd,
-        input=spec.encode(),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        check=False,
-    )
-    if res.returncode != 0:
-        raise subprocess.CalledProcessError(
-            res.returncode,
-            "git cat-file --batch",
-            output=res.stdout.decode(),
-            stderr=res.stderr.decode(),
-        )
-
-    out = BytesIO(res.stdout)
-    results: dict[str, str | None] = {}
-    for path in paths:
-        header = out.readline().decode().strip()
-        if not header:
-            results[path] = None
-            continue
-        if header.endswith(" missing"):
-            results[path] = None
-            continue
-        _sha, _typ, size_str = header.split()
-        size = int(size_str)
-        content = out.read(size).decode()
-        out.read(1)
-        results[path] = content
+    with _cat_file(cwd) as bcf:
+        results = dict(bcf.read_many(paths, ref))
+    _blob_store(ref, cwd).update(results)
     return results
 
 
 def read_files_at_ref(
     ref: str, paths: Iterable[str], cwd: str | None = None
 ) -> dict[str, str | None]:
-    """Read multiple file contents at ``ref`` in a single subprocess call.
+    """Read multiple file contents at ``ref`` in a single subprocess.
 
     Results are cached per ``(ref, tuple(paths), cwd)`` for improved
-    performance. Use ``read_files_at_ref.cache_clear()`` to invalidate.
+    performance. Use :func:`clear_caches` to invalidate.
 
     Args:
         ref: Git reference at which to read files.
@@ -211,15 +537,75 @@ def read_files_at_ref(
     return dict(_read_files_at_ref_cached(ref, paths_tuple, cwd))
 
 
-read_files_at_ref.cache_clear = _read_files_at_ref_cached.cache_clear  # type: ignore[attr-defined]
+def iter_files_at_ref(
+    ref: str, paths: Iterable[str], cwd: str | None = None
+) -> Iterator[tuple[str, str | None]]:
+    """Yield file contents at ``ref`` as soon as each one is read.
 
+    Files fetched by an earlier read are served from memory. The remaining
+    paths are streamed through a :class:`BatchCatFile` shared by every
+    reference in the repository and remembered for later calls, so
+    consumers can start work on the first file while git is still
+    producing the rest.
 
-read_file_at_ref.cache_clear = read_files_at_ref.cache_clear  # type: ignore[attr-defined]
+    Args:
+        ref: Git reference at which to read files.
+        paths: Iterable of file paths relative to the repository root.
+        cwd: Repository path.
+
+    Yields:
+        Tuples of path and contents, or ``None`` for files that do not
+        exist at ``ref``, in the order given.
+    """
+
+    store = _blob_store(ref, cwd)
+    paths = list(paths)
+    cached = [path in store for path in paths]
+    pending = [path for path, hit in zip(paths, cached) if not hit]
+    if not pending:
+        for path in paths:
+            yield path, store[path]
+        return
+    with _cat_file(cwd) as bcf:
+        # Misses arrive in request order, so interleave them with the hits.
+        batch = bcf.read_many(pending, ref)
+        try:
+            for path, hit in zip(paths, cached):
+                if hit:
+                    yield path, store[path]
+                else:
+                    _path, content = next(batch)
+                    store[path] = content
+                    yield path, content
+        finally:
+            # Drain unread responses before the shared process is released.
+            batch.close()
+
+
+def clear_caches() -> None:
+    """Drop cached listings, file contents and release lookups.
+
+    These are keyed by reference names, so they go stale once a commit or
+    tag moves a reference. Shared ``git cat-file`` processes stay running.
+    """
 
+    _list_py_files_at_ref_cached.cache_clear()
+    _list_py_blobs_at_ref_cached.cache_clear()
+    _read_files_at_ref_cached.cache_clear()
+    with _BLOB_STORE_LOCK:
+        _BLOB_STORE.clear()
+    last_release_commit.cache_clear()
 
+
+@lru_cache(maxsize=None)
 def last_release_commit(cwd: str | None = None) -> str | None:
     """Return the most recent release commit created by bumpwright.
 
+    Results are cached per ``cwd`` since a single command consults the
+    release commit several times. Commands call
+    ``last_release_commit.cache_clear()`` on entry and after creating a
+    release commit.
+
     Args:
         cwd: Repository path to inspect.
 
@@ -261,6 +647,28 @@ def collect_commits(
     return commits
 
 
+def collect_commit_messages(base: str, head: str, cwd: str | None = None) -> dict[str, str]:
+    """Return full commit messages between two references in one git call.
+
+    Args:
+        base: Older git reference (exclusive).
+        head: Newer git reference (inclusive).
+        cwd: Optional repository path.
+
+    Returns:
+        Mapping of short SHA, as reported by :func:`collect_commits`, to the
+        commit message including subject and body.
+    """
+
+    out = _run(["git", "log", "--format=%h%x00%B%x1e", f"{base}..{head}"], cwd)
+    messages: dict[str, str] = {}
+    for record in out.split("\x1e"):
+        sha, sep, message = record.lstrip("\n").partition("\x00")
+        if sep:
+            messages[sha] = message
+    return messages
+
+
 def commit_message(ref: str, cwd: str | None = None) -> str:
     """Return the full commit message for ``ref``.
 
@@ -9,14 +9,16 @@ so dynamically constructed symbols or runtime side effects may be missed.
 from __future__ import annotations
 
 import ast
-from collections.abc import Iterable
+import re
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 # --------- Data model ---------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Param:
     """Function parameter description.
 
@@ -34,7 +36,7 @@ class Param:
     annotation: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FuncSig:
     """Public function or method signature.
 
@@ -55,6 +57,15 @@ PublicAPI = dict[str, FuncSig]  # symbol -> function signature (functions & meth
 
 # --------- Helpers ---------
 
+# AST node type groups checked for every statement or element scanned.
+_FUNC_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_DEF_TYPES = (*_FUNC_TYPES, ast.ClassDef)
+_SEQ_TYPES = (ast.List, ast.Tuple)
+_BLOCK_TYPES = (ast.excepthandler, ast.match_case)
+
+# Sources without either keyword cannot define functions or classes.
+_DEFINITION_RE = re.compile(r"\b(?:def|class)\b")
+
 
 def render_node(node: ast.AST | None) -> str | None:
     """Render AST nodes such as expressions or annotations.
@@ -66,7 +77,46 @@ def render_node(node: ast.AST | None) -> str | None:
         String representation of the node or ``None`` if ``node`` is ``None``.
     """
 
-    return ast.unparse(node) if node is not None else None
+    if node is None:
+        return None
+    # Fast paths for the shapes most annotations and defaults take; each
+    # matches ``ast.unparse`` output exactly.
+    node_type = type(node)
+    if node_type is ast.Name:
+        return node.id  # type: ignore[attr-defined]
+    if (
+        node_type is ast.Constant
+        and node.kind is None  # type: ignore[attr-defined]
+        and _is_plain_constant(node.value)  # type: ignore[attr-defined]
+    ):
+        return repr(node.value)  # type: ignore[attr-defined]
+    if node_type is ast.Attribute:
+        dotted = _dotted_name(node)  # type: ignore[arg-type]
+        if dotted is not None:
+            return dotted
+    return ast.unparse(node)
+
+
+def _is_plain_constant(value: object) -> bool:
+    """Return whether ``ast.unparse`` renders constant ``value`` as its ``repr``."""
+
+    if type(value) is str:
+        return value.isprintable() and not any(ch in value for ch in "'\"\\")
+    return type(value) in (int, bool) or value is None
+
+
+def _dotted_name(node: ast.Attribute) -> str | None:
+    """Render an attribute chain such as ``a.b.c`` rooted at a plain name."""
+
+    parts: list[str] = []
+    current: ast.expr = node
+    while isinstance(current, ast.Attribute):
+        parts.append(current.attr)
+        current = current.value
+    if not isinstance(current, ast.Name):
+        return None
+    parts.append(current.id)
+    return ".".join(reversed(parts))
 
 
 def _parse_exports(mod: ast.Module) -> set[str] | None:
@@ -94,7 +144,7 @@ def _parse_exports(mod: ast.Module) -> set[str] | None:
         * References to previously assigned names stored in ``env``.
         """
 
-        if isinstance(node, (ast.List, ast.Tuple)):
+        if isinstance(node, _SEQ_TYPES):
             out: list[str] = []
             for el in node.elts:
                 if isinstance(el, ast.Constant) and isinstance(el.value, str):
@@ -126,61 +176,15 @@ def _parse_exports(mod: ast.Module) -> set[str] | None:
     return None
 
 
-def _positional_params(args: ast.arguments) -> list[Param]:
-    """Build positional-only and positional-or-keyword parameters.
-
-    Args:
-        args: Function arguments node from the AST.
+@lru_cache(maxsize=65536)
+def _mk_param(name: str, kind: str, default: str | None, annotation: str | None) -> Param:
+    """Return a shared :class:`Param` for recurring parameters like ``self``.
 
-    Returns:
-        Positional parameter descriptors in declaration order.
+    ``Param`` is immutable, so identical descriptors can safely be interned;
+    this keeps large APIs from holding thousands of equal copies.
     """
 
-    posonly = list(args.posonlyargs)
-    pos = list(args.args)
-    defaults = list(args.defaults)
-    # Defaults apply to the tail of the combined positional parameters.
-    total = len(posonly) + len(pos)
-    d_start = total - len(defaults)
-    out: list[Param] = []
-
-    for idx, param in enumerate(posonly + pos):
-        default = render_node(defaults[idx - d_start]) if idx >= d_start else None
-        kind = "posonly" if idx < len(posonly) else "pos"
-        out.append(Param(param.arg, kind, default, render_node(param.annotation)))
-    return out
-
-
-def _vararg_param(args: ast.arguments) -> list[Param]:
-    """Return variable positional parameter if present."""
-
-    if args.vararg:
-        return [Param(args.vararg.arg, "vararg", None, render_node(args.vararg.annotation))]
-    return []
-
-
-def _kwonly_params(args: ast.arguments) -> list[Param]:
-    """Build keyword-only parameters in declaration order."""
-
-    out: list[Param] = []
-    for param, default in zip(args.kwonlyargs, args.kw_defaults):
-        out.append(
-            Param(
-                param.arg,
-                "kwonly",
-                render_node(default),
-                render_node(param.annotation),
-            )
-        )
-    return out
-
-
-def _varkw_param(args: ast.arguments) -> list[Param]:
-    """Return variable keyword parameter if present."""
-
-    if args.kwarg:
-        return [Param(args.kwarg.arg, "varkw", None, render_node(args.kwarg.annotation))]
-    return []
+    return Param(name, kind, default, annotation)
 
 
 def _param_list(args: ast.arguments) -> list[Param]:
@@ -194,18 +198,31 @@ def _param_list(args: ast.arguments) -> list[Param]:
     """
 
     params: list[Param] = []
+    append = params.append
+    posonly = args.posonlyargs
+    defaults = args.defaults
+    # Defaults apply to the tail of the combined positional parameters.
+    d_start = len(posonly) + len(args.args) - len(defaults)
 
     # Capture positional-only and positional-or-keyword parameters.
-    params.extend(_positional_params(args))
+    for idx, param in enumerate(posonly):
+        default = render_node(defaults[idx - d_start]) if idx >= d_start else None
+        append(_mk_param(param.arg, "posonly", default, render_node(param.annotation)))
+    for idx, param in enumerate(args.args, len(posonly)):
+        default = render_node(defaults[idx - d_start]) if idx >= d_start else None
+        append(_mk_param(param.arg, "pos", default, render_node(param.annotation)))
 
     # Include *args if provided.
-    params.extend(_vararg_param(args))
+    if args.vararg:
+        append(_mk_param(args.vararg.arg, "vararg", None, render_node(args.vararg.annotation)))
 
     # Append keyword-only parameters following * or *args.
-    params.extend(_kwonly_params(args))
+    for param, default in zip(args.kwonlyargs, args.kw_defaults):
+        append(_mk_param(param.arg, "kwonly", render_node(default), render_node(param.annotation)))
 
     # Include **kwargs if provided.
-    params.extend(_varkw_param(args))
+    if args.kwarg:
+        append(_mk_param(args.kwarg.arg, "varkw", None, render_node(args.kwarg.annotation)))
 
     return params
 
@@ -225,69 +242,77 @@ def _is_public(name: str, private_prefixes: tuple[str, ...]) -> bool:
     return not name.startswith(private_prefixes)
 
 
-# --------- Visitor that collects public API ---------
+# --------- Collecting the public API ---------
 
 
-class _APIVisitor(ast.NodeVisitor):
-    """Collect public function and method signatures from a module."""
+def _func_sig(fullname: str, node: ast.FunctionDef | ast.AsyncFunctionDef) -> FuncSig:
+    """Build the signature of a function or method definition."""
 
-    def __init__(
-        self,
-        module_name: str,
-        exports: set[str] | None,
-        private_prefixes: tuple[str, ...],
-    ) -> None:
-        """Initialize the visitor.
+    return FuncSig(fullname, tuple(_param_list(node.args)), render_node(node.returns))
 
-        Args:
-            module_name: Name of the module being inspected.
-            exports: Explicitly exported symbols if ``__all__`` is defined.
-                ``None`` indicates that all public symbols are considered.
-            private_prefixes: Symbol prefixes treated as private.
-        """
 
-        self.module_name = module_name
-        self.exports = exports
-        self.private_prefixes = private_prefixes
-        self.sigs: list[FuncSig] = []
-
-    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:  # noqa: D401
-        """Collect function definitions."""
-
-        fn = node.name
-        if self.exports is not None and fn not in self.exports:
-            return
-        if not _is_public(fn, self.private_prefixes):
-            return
-        params = tuple(_param_list(node.args))
-        ret = render_node(node.returns)
-        self.sigs.append(FuncSig(f"{self.module_name}:{fn}", params, ret))
-
-    # Async functions have the same signature representation
-    visit_AsyncFunctionDef = visit_FunctionDef
-
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # noqa: D401
-        """Collect method signatures from public classes."""
-
-        cname = node.name
-        if self.exports is not None and cname not in self.exports:
-            return
-        if not _is_public(cname, self.private_prefixes):
-            return
-
-        for elt in node.body:
-            if isinstance(elt, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                mname = elt.name
-                if not _is_public(mname, self.private_prefixes):
-                    continue
-                params = tuple(_param_list(elt.args))
-                ret = render_node(elt.returns)
-                self.sigs.append(FuncSig(f"{self.module_name}:{cname}.{mname}", params, ret))
+def _nested_statements(node: ast.stmt) -> Iterator[ast.stmt]:
+    """Yield statements nested directly inside a compound statement.
+
+    Covers the bodies of ``if``, ``try``, ``with``, loops and ``match``
+    blocks, including exception handlers and match cases. Expressions are
+    never entered since they cannot contain definitions.
+    """
+
+    for _field, value in ast.iter_fields(node):
+        if not isinstance(value, list):
+            continue
+        for item in value:
+            if isinstance(item, ast.stmt):
+                yield item
+            elif isinstance(item, _BLOCK_TYPES):
+                yield from item.body
+
+
+def _collect_sigs(
+    body: Iterable[ast.stmt],
+    module_name: str,
+    exports: set[str] | None,
+    private_prefixes: tuple[str, ...],
+) -> Iterator[FuncSig]:
+    """Yield public function and method signatures defined by ``body``.
+
+    Only module-level statements and the top level of public class bodies
+    are inspected; function bodies are skipped entirely.
+
+    Args:
+        body: Statements to scan in source order.
+        module_name: Name of the module being inspected.
+        exports: Explicitly exported symbols if ``__all__`` is defined.
+            ``None`` indicates that all public symbols are considered.
+        private_prefixes: Symbol prefixes treated as private.
+
+    Yields:
+        Signatures in source order.
+    """
+
+    for node in body:
+        if isinstance(node, _DEF_TYPES):
+            name = node.name
+            if (exports is not None and name not in exports) or not _is_public(name, private_prefixes):
+                continue
+            if not isinstance(node, ast.ClassDef):
+                yield _func_sig(f"{module_name}:{name}", node)
+                continue
+            for elt in node.body:
+                if isinstance(elt, _FUNC_TYPES) and _is_public(elt.name, private_prefixes):
+                    yield _func_sig(f"{module_name}:{name}.{elt.name}", elt)
+        else:
+            yield from _collect_sigs(_nested_statements(node), module_name, exports, private_prefixes)
 
 
+@lru_cache(maxsize=4096)
 def module_name_from_path(root: str, path: str) -> str:
     """Convert a file path to a module name relative to ``root``.
 
+    Results are memoised, so paths shared by the base and head references
+    are converted once.
+
     Args:
         root: Root directory of the package.
         path: File path under ``root``.
@@ -320,13 +345,22 @@ def extract_public_api_from_source(
 
     Returns:
         Mapping of symbol names to :class:`FuncSig` objects.
+
+    Raises:
+        SyntaxError: If ``code`` is invalid source that mentions ``def`` or
+            ``class``. Sources without either keyword define nothing and are
+            not parsed at all.
     """
 
-    mod = ast.parse(code) if isinstance(code, str) else code
+    if isinstance(code, str):
+        if not _DEFINITION_RE.search(code):
+            return {}
+        mod = ast.parse(code)
+    else:
+        mod = code
     exports = _parse_exports(mod)
-    visitor = _APIVisitor(module_name, exports, tuple(private_prefixes))
-    visitor.visit(mod)
-    return {s.fullname: s for s in visitor.sigs}
+    sigs = _collect_sigs(mod.body, module_name, exports, tuple(private_prefixes))
+    return {sig.fullname: sig for sig in sigs}
 
 
 __all__ = [
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import os
 import re
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from fnmatch import fnmatch
 from functools import cache, lru_cache
 from glob import glob
 from pathlib import Path
@@ -14,6 +14,7 @@ from tomlkit import dumps as toml_dumps
 from tomlkit import parse as toml_parse
 
 from .config import Config, load_config
+from .gitutils import _compile_ignores
 from .types import BumpLevel
 from .version_schemes import get_version_scheme
 
@@ -300,7 +301,7 @@ def _resolve_files_cached(patterns: tuple[str, ...], ignore: tuple[str, ...], ba
     """
 
     out: set[Path] = set()
-    ignore_list = list(ignore)
+    ignored = _compile_ignores(ignore)
     base = Path(base_dir)
     for pat in patterns:
         pat_path = Path(pat)
@@ -314,7 +315,9 @@ def _resolve_files_cached(patterns: tuple[str, ...], ignore: tuple[str, ...], ba
                 rel_str = str(p.resolve().relative_to(base))
             except ValueError:
                 rel_str = path_str
-            if any(fnmatch(path_str, ig) or fnmatch(rel_str, ig) for ig in ignore_list):
+            if ignored is not None and (
+                ignored.match(os.path.normcase(path_str)) or ignored.match(os.path.normcase(rel_str))
+            ):
                 continue
             out.add(p)
     # Ensure deterministic ordering for predictable downstream operations.
@@ -138,6 +138,11 @@ def init(args: argparse.Namespace) -> int:
         "Regex pattern for commit subjects to exclude from changelog " "(repeatable)."
     ),
 )
+@click.option(
+    "--jobs",
+    type=int,
+    help="Worker processes for source analysis; 0 uses every CPU. Overrides configuration.",
+)
 @click.pass_obj
 def bump(args: argparse.Namespace, **kwargs: object) -> int:
     """Update version metadata and optionally commit and tag the change.
@@ -198,6 +203,9 @@ def bump(args: argparse.Namespace, **kwargs: object) -> int:
             changelog_exclude (tuple[str, ...]): Regex patterns of commit
             subjects to omit from changelog entries.
 
+            jobs (int | None): Worker processes used for source analysis.
+            ``0`` uses every CPU.
+
     Returns:
         Exit status code, where ``0`` indicates success and ``1`` an error.
     """
@@ -38,20 +38,21 @@ def test_is_const_str() -> None:
 def test_iter_py_files_at_ref_single_git_call(monkeypatch):
     calls: list[tuple[str, tuple[str, ...]]] = []
 
-    def fake_read_files_at_ref(ref: str, paths: list[str], cwd: str | None = None):
+    def fake_iter_files_at_ref(ref: str, paths: list[str], cwd: str | None = None):
         calls.append((ref, tuple(paths)))
-        return {p: f"{p}-contents" for p in paths}
+        for p in paths:
+            yield p, f"{p}-contents"
 
-    def fake_list_py_files_at_ref(
+    def fake_list_py_files_with_sha(
         ref: str,
         roots: list[str],
         ignore_globs: list[str] | None = None,
         cwd: str | None = None,
-    ) -> set[str]:
-        return {"a.py", "b.py"}
+    ) -> list[tuple[str, str]]:
+        return [("a.py", "1" * 40), ("b.py", "2" * 40)]
 
-    monkeypatch.setattr(utils, "read_files_at_ref", fake_read_files_at_ref)
-    monkeypatch.setattr(utils, "list_py_files_at_ref", fake_list_py_files_at_ref)
+    monkeypatch.setattr(utils, "iter_files_at_ref", fake_iter_files_at_ref)
+    monkeypatch.setattr(utils, "list_py_files_with_sha", fake_list_py_files_with_sha)
 
     files = dict(iter_py_files_at_ref("HEAD", ["."], []))
 
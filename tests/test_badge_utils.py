@@ -33,6 +33,14 @@ def test_read_coverage(tmp_path: Path) -> None:
     assert read_coverage(coverage_xml) == expected
 
 
+def test_read_coverage_stops_at_root(tmp_path: Path) -> None:
+    coverage_xml = tmp_path / "coverage.xml"
+    body = "<package name='pkg'/>" * 10_000
+    coverage_xml.write_text(f"<coverage line-rate='0.5'>{body}<unclosed>")
+    expected = 50.0
+    assert read_coverage(coverage_xml) == expected
+
+
 def test_generate_badges(tmp_path: Path) -> None:
     output = tmp_path / "badges"
     generate_badges(output, 80.0, "1.2.3", "MIT", "3.11")
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import bumpwright.public_api
+from bumpwright import cache, gitutils
+from bumpwright.cli import decide
+from bumpwright.public_api import FuncSig, Param
+
+
+@pytest.fixture(autouse=True)
+def _canonical_public_api(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Other tests swap this module out; pickling needs the canonical one.
+    monkeypatch.setitem(sys.modules, "bumpwright.public_api", bumpwright.public_api)
+
+
+def _init_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    (repo / "pkg" / "mod.py").write_text("def run(x: int) -> int:\n    return x\n")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "init"], str(repo))
+    return repo
+
+
+def test_store_and_load_round_trip(tmp_path: Path) -> None:
+    sig = FuncSig("mod:run", (Param("x", "pos", None, "int"),), "int")
+    cache.store(tmp_path, "api", "key", {"mod:run": sig})
+    assert cache.load(tmp_path, "api", "key") == {"mod:run": sig}
+    assert cache.load(tmp_path, "api", "other") is None
+
+
+def test_load_ignores_corrupt_entries(tmp_path: Path) -> None:
+    cache.store(tmp_path, "api", "key", {"a": 1})
+    (entry,) = (p for p in tmp_path.rglob("*") if p.is_file())
+    entry.write_bytes(b"not a pickle")
+    assert cache.load(tmp_path, "api", "key") is None
+
+
+def test_cache_root_inside_git_dir(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    cache.clear_caches()
+    assert cache.cache_root(str(repo)) == (repo / ".git" / "bumpwright").resolve()
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    with patch.dict(os.environ, {"GIT_CEILING_DIRECTORIES": str(tmp_path)}):
+        assert cache.cache_root(str(outside)) is None
+
+
+def test_build_api_reuses_disk_cache(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    cache_dir = tmp_path / "cache"
+    old = os.getcwd()
+    os.chdir(repo)
+    try:
+        decide._API_BY_BLOB.clear()
+        decide.clear_caches()
+        first = decide._build_api_at_ref("HEAD", ["pkg"], [], ["_"], cache_dir=cache_dir)
+        decide._API_BY_BLOB.clear()
+        decide.clear_caches()
+        with patch("bumpwright.cli.decide.iter_files_at_ref") as reads:
+            second = decide._build_api_at_ref("HEAD", ["pkg"], [], ["_"], cache_dir=cache_dir)
+    finally:
+        os.chdir(old)
+    assert set(first) == {"mod:run"}
+    assert second == first
+    reads.assert_not_called()
@@ -2,12 +2,13 @@ import logging
 import os
 import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 from bumpwright.analysers import load_enabled
 from bumpwright.analysers.cli import CLIAnalyser, diff_cli, extract_cli_from_source
-from bumpwright.cli.decide import _run_analysers
+from bumpwright.cli.decide import _format_impacts_text, _run_analysers
 from bumpwright.compare import Impact
-from bumpwright.config import Config, Ignore, Project
+from bumpwright.config import Analysers, Config, Ignore, Project
 
 
 def _build(src: str):
@@ -183,3 +184,39 @@ def test_run_analysers_warns_for_unknown(caplog) -> None:
         impacts = _run_analysers("base", "head", cfg, enable=["unknown"])  # no analyser
     assert impacts == []
     assert "Analyser 'unknown' is not registered" in caplog.text
+
+
+def test_run_analysers_skips_untouched_roots() -> None:
+    cfg = Config(project=Project(public_roots=["pkg"]))
+    with patch.object(CLIAnalyser, "collect", return_value={}) as collect:
+        _run_analysers("base", "head", cfg, enable=["cli"], changed={"docs/index.rst"})
+        assert collect.call_count == 0
+        _run_analysers("base", "head", cfg, enable=["cli"], changed={"pkg/cli.py"})
+        assert collect.call_count == 2  # noqa: PLR2004
+
+
+def test_run_analysers_skips_unwatched_suffixes() -> None:
+    cfg = Config(project=Project(public_roots=["pkg"]))
+    with patch.object(CLIAnalyser, "collect", return_value={}) as collect:
+        _run_analysers("base", "head", cfg, enable=["cli"], changed={"pkg/schema.graphql"})
+        assert collect.call_count == 0
+
+
+def test_run_analysers_order_is_stable() -> None:
+    cfg = Config(analysers=Analysers(enabled={"web_routes", "cli", "migrations"}))
+    seen: list[str] = []
+
+    def fake_info(name: str) -> None:
+        seen.append(name)
+
+    with patch("bumpwright.cli.decide.get_analyser_info", side_effect=fake_info):
+        _run_analysers("base", "head", cfg, enable=["graphql", "cli"], disable=["migrations"])
+    assert seen == ["cli", "web_routes", "graphql"]
+
+
+def test_format_impacts_text() -> None:
+    impacts = [Impact("major", "cli:run", "Removed command"), Impact("minor", "cli:new", "Added command")]
+    assert _format_impacts_text(impacts) == (
+        "- [MAJOR] cli:run: Removed command\n- [MINOR] cli:new: Added command"
+    )
+    assert _format_impacts_text([]) == "(no API-impacting changes detected)"
@@ -3,9 +3,13 @@ import os
 import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
+import pytest
 from cli_helpers import setup_repo
 
+from bumpwright.cli import decide
+
 
 def test_bump_command_json_format(tmp_path: Path) -> None:
     """Ensure bump emits machine-readable JSON when requested."""
@@ -40,3 +44,19 @@ def test_bump_command_json_format(tmp_path: Path) -> None:
     assert data["level"] == "minor"
     assert data["confidence"] == 1.0
     assert data["reasons"] == []
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"level": "minor", "confidence": 0.5, "reasons": ["Added public symbol"], "files": []},
+        {"level": None, "impacts": [{"symbol": "pkg:naïve_café", "reason": "Removed 🚀 \u2028"}], "extra": {}},
+    ],
+)
+def test_dump_json_matches_stdlib_fallback(payload: dict) -> None:
+    pytest.importorskip("orjson")
+    fast = decide._dump_json(payload)
+    with patch.object(decide, "orjson", None):
+        slow = decide._dump_json(payload)
+    assert fast == slow == json.dumps(payload, indent=2, ensure_ascii=False)
+    assert json.loads(fast) == payload
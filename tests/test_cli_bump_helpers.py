@@ -8,6 +8,8 @@ from pathlib import Path
 import pytest
 from cli_helpers import run, setup_repo
 
+from bumpwright import gitutils
+from bumpwright.analysers.utils import parse_python_source
 from bumpwright.compare import Decision
 from bumpwright.config import load_config
 from bumpwright.versioning import VersionChange
@@ -20,8 +22,11 @@ from bumpwright.cli.bump import (  # isort:skip
     _resolve_pyproject,
     _read_template,
     _build_changelog,
+    _compile_template,
     get_default_template,
     _write_changelog,
+    _jobs_override,
+    _reset_ref_caches,
 )
 
 
@@ -42,6 +47,25 @@ def test_prepare_version_files_no_relevant_changes(tmp_path: Path) -> None:
     assert paths is None
 
 
+@pytest.mark.parametrize(("level", "expected_none"), [(None, True), ("patch", False)])
+def test_prepare_version_files_ignored_changes(tmp_path: Path, level: str | None, expected_none: bool) -> None:
+    repo, _, base = setup_repo(tmp_path)
+    tests_dir = repo / "tests"
+    tests_dir.mkdir()
+    (tests_dir / "test_pkg.py").write_text("def test_ok() -> None:\n    pass\n", encoding="utf-8")
+    run(["git", "add", "tests"], repo)
+    run(["git", "commit", "-m", "test: add tests"], repo)
+    cfg = load_config(repo / "bumpwright.toml")
+    args = argparse.Namespace(version_path=None, level=level)
+    cwd = os.getcwd()
+    os.chdir(repo)
+    try:
+        paths = _prepare_version_files(cfg, args, repo / "pyproject.toml", base, "HEAD")
+    finally:
+        os.chdir(cwd)
+    assert (paths is None) is expected_none
+
+
 def test_prepare_version_files_wildcard_directory(tmp_path: Path) -> None:
     repo, _, base = setup_repo(tmp_path)
     extra_pkg = repo / "pkg_extra"
@@ -74,6 +98,20 @@ def test_safe_changed_paths_warns(monkeypatch, caplog) -> None:
     assert "BASE" in caplog.text and "HEAD" in caplog.text
 
 
+@pytest.mark.parametrize(
+    ("cli", "env", "expected"),
+    [(None, None, None), (None, "4", 4), (2, "4", 2), (None, "many", None), (0, None, 0)],
+)
+def test_jobs_override(monkeypatch, caplog, cli: int | None, env: str | None, expected: int | None) -> None:
+    if env is None:
+        monkeypatch.delenv("BUMPWRIGHT_JOBS", raising=False)
+    else:
+        monkeypatch.setenv("BUMPWRIGHT_JOBS", env)
+    with caplog.at_level(logging.WARNING):
+        assert _jobs_override(argparse.Namespace(jobs=cli)) == expected
+    assert ("BUMPWRIGHT_JOBS" in caplog.text) == (env == "many")
+
+
 def test_resolve_pyproject_missing() -> None:
     """Ensure resolving a missing pyproject raises an informative error."""
 
@@ -136,6 +174,12 @@ def test_get_default_template_reads_file() -> None:
     assert get_default_template() == expected
 
 
+def test_compile_template_reuses_compiled_template() -> None:
+    first = _compile_template("Version={{ version }}")
+    assert _compile_template("Version={{ version }}") is first
+    assert first.render(version="1.0.0") == "Version=1.0.0"
+
+
 def test_build_changelog_uses_read_template(monkeypatch) -> None:
     args = argparse.Namespace(changelog="CHANGELOG.md", head="HEAD", repo_url=None, changelog_template=None)
     monkeypatch.setattr("bumpwright.cli.bump.collect_commits", lambda base, head: [])
@@ -204,3 +248,24 @@ def test_commit_tag_stages_all_files(tmp_path: Path) -> None:
     assert "pkg/__init__.py" in files
     msg = run(["git", "log", "-1", "--pretty=%s"], repo)
     assert msg == "chore(release): 0.1.1"
+
+
+def test_reset_ref_caches_drops_stale_ref_contents(tmp_path: Path) -> None:
+    """Reads and parses keyed by ``HEAD`` follow the ref after a reset."""
+
+    repo, pkg, _ = setup_repo(tmp_path)
+    cwd = str(repo)
+    _reset_ref_caches()
+    old_files = gitutils.list_py_files_at_ref("HEAD", ["pkg"], cwd=cwd)
+    old_tree = parse_python_source("HEAD", "pkg/__init__.py", cwd)
+    (pkg / "extra.py").write_text("def bar() -> int:\n    return 2\n", encoding="utf-8")
+    (pkg / "__init__.py").write_text("def changed() -> None:\n    pass\n", encoding="utf-8")
+    run(["git", "add", "pkg"], repo)
+    run(["git", "commit", "-m", "feat: add bar"], repo)
+
+    assert gitutils.list_py_files_at_ref("HEAD", ["pkg"], cwd=cwd) == old_files
+    _reset_ref_caches()
+    assert "pkg/extra.py" in gitutils.list_py_files_at_ref("HEAD", ["pkg"], cwd=cwd)
+    new_tree = parse_python_source("HEAD", "pkg/__init__.py", cwd)
+    assert new_tree is not old_tree
+    assert gitutils.read_file_at_ref("HEAD", "pkg/__init__.py", cwd).startswith("def changed")
@@ -100,3 +100,11 @@ def test_bump_command_requires_clean_worktree(tmp_path: Path) -> None:
     assert res.returncode == 1
     assert "working directory has uncommitted changes" in res.stderr
     assert read_project_version(repo / "pyproject.toml") == "0.1.0"
+
+
+def test_cli_import_defers_heavy_dependencies() -> None:
+    """Importing the CLI should not load graphql, jinja2, process pools or subcommands."""
+    heavy = ("graphql", "jinja2", "concurrent.futures.process", "bumpwright.cli.bump", "tomlkit")
+    code = f"import sys, bumpwright.cli; print(sorted(m for m in {heavy!r} if m in sys.modules))"
+    res = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert res.stdout.strip() == "[]"
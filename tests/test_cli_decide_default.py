@@ -3,9 +3,14 @@ import os
 import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 from cli_helpers import run, setup_repo
 
+from bumpwright import gitutils
+from bumpwright.cli import decide, get_parser
+from bumpwright.cli.bump import _reset_ref_caches
+
 
 def test_decide_flag_defaults_to_previous_commit(tmp_path: Path) -> None:
     repo, pkg, _ = setup_repo(tmp_path)
@@ -36,3 +41,81 @@ def test_decide_flag_defaults_to_previous_commit(tmp_path: Path) -> None:
     assert data["level"] == "minor"
     assert data["confidence"] == 1.0
     assert data["reasons"] == ["Added public symbol"]
+
+
+def test_decide_skips_parsing_without_relevant_changes(tmp_path: Path, caplog) -> None:
+    repo, _, _ = setup_repo(tmp_path)
+    pyproj = repo / "pyproject.toml"
+    pyproj.write_text(pyproj.read_text().replace("0.1.0", "0.1.1"), encoding="utf-8")
+    run(["git", "add", "pyproject.toml"], repo)
+    run(["git", "commit", "-m", "chore: bump version"], repo)
+
+    args = get_parser().parse_args(["bump", "--decide"])
+    cwd = os.getcwd()
+    os.chdir(repo)
+    try:
+        with (
+            caplog.at_level("INFO"),
+            patch("bumpwright.cli.decide._build_api_at_ref") as build,
+        ):
+            assert args.func(args) == 0
+    finally:
+        os.chdir(cwd)
+    build.assert_not_called()
+    assert "Suggested bump: None" in caplog.text
+
+
+def test_decide_extracts_only_changed_modules(tmp_path: Path, caplog) -> None:
+    repo, pkg, _ = setup_repo(tmp_path)
+    (pkg / "extra.py").write_text("def bar() -> int:\n    return 2\n", encoding="utf-8")
+    run(["git", "add", "pkg/extra.py"], repo)
+    run(["git", "commit", "-m", "feat: add bar"], repo)
+
+    args = get_parser().parse_args(["bump", "--decide", "--format", "json"])
+    cwd = os.getcwd()
+    os.chdir(repo)
+    try:
+        decide._API_BY_BLOB.clear()
+        _reset_ref_caches()
+        with (
+            caplog.at_level("INFO"),
+            patch(
+                "bumpwright.cli.decide.extract_public_api_from_source",
+                wraps=decide.extract_public_api_from_source,
+            ) as extract,
+            patch("bumpwright.gitutils._run", wraps=gitutils._run) as git,
+        ):
+            assert args.func(args) == 0
+    finally:
+        os.chdir(cwd)
+    assert [call.args[0] for call in extract.call_args_list] == ["extra"]
+    diffs = [call for call in git.call_args_list if call.args[0][:2] == ["git", "diff"]]
+    assert len(diffs) == 1
+    data = json.loads(caplog.text[caplog.text.index("{") :])
+    assert data["level"] == "minor"
+    assert data["reasons"] == ["Added public symbol"]
+
+
+def test_decide_compares_modules_listed_as_version_files(tmp_path: Path, caplog) -> None:
+    repo, pkg, _ = setup_repo(tmp_path)
+    meta = pkg / "meta.py"
+    meta.write_text("__version__ = '0.1.0'\n\ndef f() -> int:\n    return 1\n", encoding="utf-8")
+    run(["git", "add", "pkg/meta.py"], repo)
+    run(["git", "commit", "-m", "feat: add meta"], repo)
+    meta.write_text("__version__ = '0.1.0'\n", encoding="utf-8")
+    run(["git", "commit", "-am", "refactor: drop f"], repo)
+
+    args = get_parser().parse_args(
+        ["bump", "--decide", "--base", "HEAD^", "--version-path", "pkg/meta.py", "--format", "json"]
+    )
+    cwd = os.getcwd()
+    os.chdir(repo)
+    try:
+        decide._API_BY_BLOB.clear()
+        with caplog.at_level("INFO"):
+            assert args.func(args) == 0
+    finally:
+        os.chdir(cwd)
+    data = json.loads(caplog.text[caplog.text.index("{") :])
+    assert data["level"] == "major"
+    assert data["impacts"] == [{"severity": "major", "symbol": "meta:f", "reason": "Removed public symbol"}]
@@ -8,6 +8,7 @@ def test_get_parser_returns_argument_parser() -> None:
     parser = get_parser()
     assert isinstance(parser, ArgumentParser)
     assert parser.prog == "bumpwright"
+    assert get_parser() is parser
 
 
 def test_parser_includes_ref_and_analyser_options() -> None:
@@ -1,5 +1,6 @@
 """Tests for public API comparison helpers."""
 
+from bumpwright import compare as compare_mod
 from bumpwright.compare import (
     Impact,
     _added_params,
@@ -180,8 +181,36 @@ def test_diff_public_api_no_changes():
     assert diff_public_api({"m:f": sig}, {"m:f": sig}) == []
 
 
+def test_diff_public_api_groups_impacts_and_skips_unchanged(monkeypatch):
+    same = _sig("m:same", [_p("x")], None)
+    old = {"m:gone": _sig("m:gone", [], None), "m:same": same, "m:f": _sig("m:f", [_p("x")], None)}
+    new = {"m:new": _sig("m:new", [], None), "m:same": same, "m:f": _sig("m:f", [_p("x")], "int")}
+    compared: list[str] = []
+    original = compare_mod.compare_funcs
+
+    def spy(old_sig, new_sig, **kwargs):
+        compared.append(old_sig.fullname)
+        return original(old_sig, new_sig, **kwargs)
+
+    monkeypatch.setattr(compare_mod, "compare_funcs", spy)
+    assert diff_public_api(old, new) == [
+        Impact(MAJOR, "m:gone", "Removed public symbol"),
+        Impact(MINOR, "m:f", "Return annotation changed"),
+        Impact(MINOR, "m:new", "Added public symbol"),
+    ]
+    assert compared == ["m:f"]
+
+
 def test_decide_bump_no_impacts():
     decision = decide_bump([])
     assert decision.level is None
     assert decision.confidence == 0.0
     assert decision.reasons == []
+
+
+def test_decide_bump_accepts_iterator():
+    impacts = iter([Impact(MINOR, "m:f", "a"), Impact("patch", "m:g", "b"), Impact(MINOR, "m:h", "c")])
+    decision = decide_bump(impacts)
+    assert decision.level == MINOR
+    assert decision.reasons == ["a", "c"]
+    assert decision.confidence == 2 / 3
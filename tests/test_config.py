@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 import tomli
 
-from bumpwright.config import Config, Rules, load_config
+from bumpwright.config import Config, Rules, _defaults, load_config
 
 
 def test_load_config_parses_analysers(tmp_path: Path) -> None:
@@ -84,10 +84,13 @@ def test_mutating_config_does_not_alter_defaults(tmp_path: Path) -> None:
     defaults = Config()
     cfg = load_config(tmp_path / "missing.toml")
     cfg.project.public_roots.append("src")
+    cfg.version.ignore.append("docs/**")
 
     fresh = load_config(tmp_path / "missing.toml")
     assert defaults.project.public_roots == ["."]
     assert fresh.project.public_roots == ["."]
+    assert "docs/**" not in fresh.version.ignore
+    assert _defaults() is _defaults()
 
 
 def test_version_ignore_defaults_extend(tmp_path: Path) -> None:
@@ -161,3 +164,10 @@ def test_load_config_invalid_param_annotation_change(tmp_path: Path) -> None:
     cfg_file.write_text("[rules]\nparam_annotation_change='build'\n")
     with pytest.raises(ValueError):
         load_config(cfg_file)
+
+
+def test_load_config_performance_jobs(tmp_path: Path) -> None:
+    cfg_file = tmp_path / "bumpwright.toml"
+    cfg_file.write_text("[performance]\njobs = 4\n")
+    assert load_config(cfg_file).performance.jobs == 4  # noqa: PLR2004
+    assert load_config(tmp_path / "missing.toml").performance.jobs == 1
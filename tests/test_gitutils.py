@@ -65,7 +65,7 @@ def test_list_py_files_at_ref_caches(tmp_path, monkeypatch):
     gitutils._run(["git", "add", "."], str(repo))
     gitutils._run(["git", "commit", "-m", "init"], str(repo))
 
-    gitutils.list_py_files_at_ref.cache_clear()
+    gitutils.clear_caches()
     original = gitutils._run
     calls: list[list[str]] = []
 
@@ -78,7 +78,29 @@ def test_list_py_files_at_ref_caches(tmp_path, monkeypatch):
     gitutils.list_py_files_at_ref("HEAD", ["."], cwd=str(repo))
     gitutils.list_py_files_at_ref("HEAD", ["."], cwd=str(repo))
     assert len(calls) == 1
-    gitutils.list_py_files_at_ref.cache_clear()
+    gitutils.clear_caches()
+
+
+def test_list_py_files_with_sha_matches_blobs(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "pkg").mkdir()
+    (repo / "pkg" / "__init__.py").write_text("\n")
+    (repo / "pkg" / "mod.py").write_text("x = 1\n")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "init"], str(repo))
+
+    gitutils.clear_caches()
+    result = gitutils.list_py_files_with_sha("HEAD", ["pkg"], cwd=str(repo))
+    expected = [
+        (path, gitutils._run(["git", "rev-parse", f"HEAD:{path}"], str(repo)).strip())
+        for path in ("pkg/__init__.py", "pkg/mod.py")
+    ]
+    assert result == expected
+    assert {p for p, _ in result} == gitutils.list_py_files_at_ref("HEAD", ["pkg"], cwd=str(repo))
 
 
 def test_collect_commits(tmp_path):
@@ -97,6 +119,26 @@ def test_collect_commits(tmp_path):
     assert commits == [(sha, "second")]
 
 
+def test_collect_commit_messages(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    (repo / "file.txt").write_text("one\n", encoding="utf-8")
+    gitutils._run(["git", "add", "file.txt"], str(repo))
+    gitutils._run(["git", "commit", "-m", "first"], str(repo))
+    for i, body in enumerate(["feat: a\n\nBREAKING CHANGE: gone", "fix: b"]):
+        (repo / "file.txt").write_text(f"{i}\n", encoding="utf-8")
+        gitutils._run(["git", "commit", "-am", body], str(repo))
+    messages = gitutils.collect_commit_messages("HEAD~2", "HEAD", str(repo))
+    assert {sha: m.rstrip() for sha, m in messages.items()} == {
+        sha: gitutils.commit_message(sha, str(repo)).rstrip()
+        for sha, _ in gitutils.collect_commits("HEAD~2", "HEAD", str(repo))
+    }
+    assert any("BREAKING CHANGE: gone" in m for m in messages.values())
+
+
 def test_infer_base_ref_with_upstream(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -152,6 +194,20 @@ def test_changed_paths(tmp_path: Path) -> None:
         gitutils.changed_paths("BAD", "HEAD", str(repo))
 
 
+def test_changed_paths_reports_both_sides_of_rename(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "old.py").write_text("def f() -> int:\n    return 1\n", encoding="utf-8")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "old.py"], str(repo))
+    gitutils._run(["git", "commit", "-m", "first"], str(repo))
+    gitutils._run(["git", "mv", "old.py", "new.py"], str(repo))
+    gitutils._run(["git", "commit", "-m", "rename"], str(repo))
+    assert gitutils.changed_paths("HEAD^", "HEAD", str(repo)) == {"old.py", "new.py"}
+
+
 def test_read_file_at_ref(tmp_path: Path) -> None:
     """Read file contents at a ref and handle missing paths."""
 
@@ -180,21 +236,33 @@ def test_read_file_at_ref_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch
     gitutils._run(["git", "add", "file.txt"], str(repo))
     gitutils._run(["git", "commit", "-m", "first"], str(repo))
 
-    gitutils.read_file_at_ref.cache_clear()
-    original = subprocess.run
+    gitutils.clear_caches()
+    original = subprocess.Popen
     calls: list[list[str]] = []
 
-    def spy(cmd: list[str], *args, **kwargs) -> subprocess.CompletedProcess:
+    def spy(cmd: list[str], *args, **kwargs) -> subprocess.Popen:
         if isinstance(cmd, list) and cmd[:3] == ["git", "cat-file", "--batch"]:
             calls.append(cmd)
         return original(cmd, *args, **kwargs)
 
-    monkeypatch.setattr(subprocess, "run", spy)
+    monkeypatch.setattr(subprocess, "Popen", spy)
     gitutils.read_file_at_ref("HEAD", "file.txt", str(repo))
     gitutils.read_file_at_ref("HEAD", "file.txt", str(repo))
     assert calls and calls[0][:3] == ["git", "cat-file", "--batch"]
     assert len(calls) == 1
-    gitutils.read_file_at_ref.cache_clear()
+    gitutils.clear_caches()
+
+
+def test_blob_store_keeps_recent_refs(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Contents are retained for a bounded number of references."""
+
+    gitutils.clear_caches()
+    monkeypatch.setattr(gitutils, "_MAX_BLOB_STORE_REFS", 2)
+    for ref in ("a", "b", "c"):
+        gitutils._blob_store(ref, None)["f.py"] = ref
+    assert list(gitutils._BLOB_STORE) == [("b", None), ("c", None)]
+    assert gitutils._blob_store("c", None) == {"f.py": "c"}
+    gitutils.clear_caches()
 
 
 def test_last_release_commit_found(tmp_path: Path) -> None:
@@ -232,12 +300,15 @@ def test_read_files_at_ref(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> N
     assert missing["file1.txt"] == "one\n"
     assert missing["missing.txt"] is None
 
-    def fake_run(cmd: list[str], *args, **kwargs) -> subprocess.CompletedProcess:
+    gitutils.close_shared_cat_files()
+    original = subprocess.Popen
+
+    def fake_popen(cmd: list[str], *args, **kwargs) -> subprocess.Popen:
         if cmd[:3] == ["git", "cat-file", "--batch"]:
-            return subprocess.CompletedProcess(cmd, 1, b"", b"bad ref")
-        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+            cmd = ["git", "cat-file", "--no-such-option"]
+        return original(cmd, *args, **kwargs)
 
-    monkeypatch.setattr(subprocess, "run", fake_run)
+    monkeypatch.setattr(subprocess, "Popen", fake_popen)
     with pytest.raises(subprocess.CalledProcessError):
         gitutils.read_files_at_ref("BAD", ["file1.txt"], str(repo))
 
@@ -255,21 +326,21 @@ def test_read_files_at_ref_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatc
     gitutils._run(["git", "add", "."], str(repo))
     gitutils._run(["git", "commit", "-m", "first"], str(repo))
 
-    gitutils.read_files_at_ref.cache_clear()
-    original = subprocess.run
+    gitutils.clear_caches()
+    original = subprocess.Popen
     calls: list[list[str]] = []
 
-    def spy(cmd: list[str], *args, **kwargs) -> subprocess.CompletedProcess:
+    def spy(cmd: list[str], *args, **kwargs) -> subprocess.Popen:
         if isinstance(cmd, list) and cmd[:3] == ["git", "cat-file", "--batch"]:
             calls.append(cmd)
         return original(cmd, *args, **kwargs)
 
-    monkeypatch.setattr(subprocess, "run", spy)
+    monkeypatch.setattr(subprocess, "Popen", spy)
     gitutils.read_files_at_ref("HEAD", ["file1.txt", "file2.txt"], str(repo))
     gitutils.read_files_at_ref("HEAD", ["file1.txt", "file2.txt"], str(repo))
     assert calls and calls[0][:3] == ["git", "cat-file", "--batch"]
     assert len(calls) == 1
-    gitutils.read_files_at_ref.cache_clear()
+    gitutils.clear_caches()
 
 
 def test_last_release_commit_none(tmp_path: Path) -> None:
@@ -284,3 +355,145 @@ def test_last_release_commit_none(tmp_path: Path) -> None:
     gitutils._run(["git", "add", "file.txt"], str(repo))
     gitutils._run(["git", "commit", "-m", "feat: initial"], str(repo))
     assert gitutils.last_release_commit(str(repo)) is None
+
+
+def test_last_release_commit_cached_until_cleared(tmp_path: Path) -> None:
+    """Reuse the release lookup until the cache is cleared."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "commit", "--allow-empty", "-m", "feat: initial"], str(repo))
+    assert gitutils.last_release_commit(str(repo)) is None
+
+    gitutils._run(["git", "commit", "--allow-empty", "-m", "chore(release): 1.0.0"], str(repo))
+    assert gitutils.last_release_commit(str(repo)) is None
+    gitutils.last_release_commit.cache_clear()
+    head = gitutils._run(["git", "rev-parse", "HEAD"], str(repo)).strip()
+    assert gitutils.last_release_commit(str(repo)) == head
+
+
+def test_batch_cat_file_streams_blobs(tmp_path: Path) -> None:
+    """Serve several reads, including missing files, from one git process."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.txt").write_text("alpha\n", encoding="utf-8")
+    (repo / "b.txt").write_bytes(b"")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "first"], str(repo))
+
+    with gitutils.BatchCatFile("HEAD", str(repo)) as bcf:
+        assert bcf.read("a.txt") == "alpha\n"
+        assert bcf.read("missing.txt") is None
+        assert bcf.read("b.txt") == ""
+        assert list(bcf.read_many(["b.txt", "a.txt"])) == [("b.txt", ""), ("a.txt", "alpha\n")]
+
+    with pytest.raises(RuntimeError):
+        bcf.read("a.txt")
+
+
+def test_iter_files_at_ref_streams_and_remembers(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Stream contents lazily and serve repeated reads from memory."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.txt").write_text("alpha\n", encoding="utf-8")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "first"], str(repo))
+
+    gitutils.clear_caches()
+    original = subprocess.Popen
+    calls: list[list[str]] = []
+
+    def spy(cmd: list[str], *args, **kwargs) -> subprocess.Popen:
+        calls.append(cmd)
+        return original(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", spy)
+    stream = gitutils.iter_files_at_ref("HEAD", ["a.txt", "gone.txt"], str(repo))
+    assert not calls
+    assert list(stream) == [("a.txt", "alpha\n"), ("gone.txt", None)]
+    assert gitutils.read_file_at_ref("HEAD", "a.txt", str(repo)) == "alpha\n"
+    assert list(gitutils.iter_files_at_ref("HEAD", ["a.txt"], str(repo))) == [("a.txt", "alpha\n")]
+    assert len(calls) == 1
+    gitutils.clear_caches()
+
+
+def test_iter_files_at_ref_keeps_request_order_on_partial_hits(tmp_path: Path) -> None:
+    """Cached and freshly read files are yielded in the order requested."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (repo / name).write_text(f"{name}\n", encoding="utf-8")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "first"], str(repo))
+
+    gitutils.clear_caches()
+    assert gitutils.read_file_at_ref("HEAD", "b.txt", str(repo)) == "b.txt\n"
+    order = [path for path, _content in gitutils.iter_files_at_ref("HEAD", ["a.txt", "b.txt", "c.txt"], str(repo))]
+    assert order == ["a.txt", "b.txt", "c.txt"]
+    gitutils.clear_caches()
+
+
+def test_cat_file_process_shared_across_refs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reuse one git process for every ref, even after an abandoned stream."""
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "a.txt").write_text("one\n", encoding="utf-8")
+    (repo / "b.txt").write_text("bee\n", encoding="utf-8")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "first"], str(repo))
+    (repo / "a.txt").write_text("two\n", encoding="utf-8")
+    gitutils._run(["git", "commit", "-am", "second"], str(repo))
+
+    gitutils.clear_caches()
+    gitutils.close_shared_cat_files()
+    original = subprocess.Popen
+    calls: list[list[str]] = []
+
+    def spy(cmd: list[str], *args, **kwargs) -> subprocess.Popen:
+        calls.append(cmd)
+        return original(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "Popen", spy)
+    stream = gitutils.iter_files_at_ref("HEAD~1", ["a.txt", "b.txt"], str(repo))
+    assert next(stream) == ("a.txt", "one\n")
+    # A nested read while the shared process is mid-stream gets its own process.
+    assert gitutils.read_file_at_ref("HEAD~1", "b.txt", str(repo)) == "bee\n"
+    stream.close()
+    assert gitutils.read_file_at_ref("HEAD", "a.txt", str(repo)) == "two\n"
+    assert gitutils.read_files_at_ref("HEAD", ["b.txt"], str(repo)) == {"b.txt": "bee\n"}
+    assert calls == [["git", "cat-file", "--batch"]] * 2  # shared process plus the nested one
+    gitutils.close_shared_cat_files()
+    gitutils.clear_caches()
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["tests/test_a.py", "pkg/tests/x.py", "pkg/mod.py", "scripts/run.py", "a/__pycache__/b.py", "setup.py"],
+)
+def test_compile_ignores_matches_fnmatch(path: str) -> None:
+    """Combined ignore pattern agrees with per-glob ``fnmatch`` checks."""
+
+    globs = ("tests/**", "scripts/*", "**/__pycache__/**", "setup.py")
+    pattern = gitutils._compile_ignores(globs)
+    assert pattern is not None
+    assert bool(pattern.match(path)) == any(fnmatch(path, g) for g in globs)
+    assert gitutils._compile_ignores(()) is None
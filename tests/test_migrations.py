@@ -3,6 +3,7 @@
 import os
 import subprocess
 from pathlib import Path
+from unittest.mock import patch
 
 try:  # pragma: no cover - handled when pytest not installed
     import pytest
@@ -10,6 +11,7 @@ except ModuleNotFoundError:  # pragma: no cover
     pytest = None  # type: ignore
 
 from bumpwright.analysers import load_enabled
+from bumpwright.analysers.migrations import _analyze_content
 from bumpwright.compare import Impact
 from bumpwright.config import Config, Migrations
 
@@ -277,3 +279,82 @@ def upgrade():
     impacts = _analyze(repo, base, head)
     severities = {i.severity for i in impacts}
     assert {"minor", "major"}.issubset(severities)
+
+
+def test_source_without_operations_is_not_parsed() -> None:
+    """Files lacking Alembic operations skip AST parsing entirely."""
+
+    with patch("bumpwright.analysers.migrations.ast.parse") as parse:
+        assert _analyze_content("m.py", "def upgrade():\n    pass\n") == []
+        assert _analyze_content("m.py", "import os\nos.path.join('a')\n") == []
+    parse.assert_not_called()
+
+
+def test_operations_outside_upgrade_are_ignored() -> None:
+    """Only calls inside the module-level ``upgrade`` function are recorded."""
+
+    content = """
+from alembic import op
+
+op.drop_table('module_level')
+
+class Helper:
+    def upgrade(self):
+        op.drop_table('method')
+
+def upgrade():
+    op.create_index('ix', 't', ['c'])
+
+def downgrade():
+    op.drop_index('ix')
+"""
+    impacts = _analyze_content("m.py", content)
+    assert [(i.severity, i.reason) for i in impacts] == [("minor", "Added index")]
+
+
+def test_conditional_upgrade_definitions_are_ignored() -> None:
+    """``upgrade`` defined inside module-level blocks is not a migration."""
+
+    content = """
+from alembic import op
+
+if True:
+    def upgrade():
+        op.drop_table('x')
+
+try:
+    def upgrade():
+        op.drop_table('y')
+except ImportError:
+    pass
+"""
+    assert _analyze_content("m.py", content) == []
+
+
+def test_nested_definitions_inside_upgrade_are_recorded() -> None:
+    """Operations in helpers defined within ``upgrade`` still count."""
+
+    content = """
+from alembic import op
+
+def upgrade():
+    def helper():
+        op.drop_column('t', 'c')
+    helper()
+"""
+    impacts = _analyze_content("m.py", content)
+    assert [(i.severity, i.reason) for i in impacts] == [("major", "Dropped column")]
+
+
+def test_non_constant_nullable_is_not_folded() -> None:
+    """Expressions such as ``not True`` are not evaluated on any interpreter."""
+
+    content = """
+from alembic import op
+import sqlalchemy as sa
+
+def upgrade():
+    op.add_column('t', sa.Column('c', sa.Integer(), nullable=not True))
+"""
+    impacts = _analyze_content("m.py", content)
+    assert [(i.severity, i.reason) for i in impacts] == [("minor", "Added column")]
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
 import logging
+from unittest.mock import patch
 
-from bumpwright.analysers.openapi import Spec, _parse_spec, diff_specs
+import pytest
+
+from bumpwright.analysers import openapi
+from bumpwright.analysers.openapi import OpenAPIAnalyser, Spec, _parse_spec, diff_specs
+from bumpwright.config import Config
 
 
 def _build(src: str) -> Spec:
@@ -84,6 +89,88 @@ components:
     assert any(i.severity == "major" and i.symbol == "Pet" for i in impacts)
 
 
+def test_schema_change_detected_without_digest() -> None:
+    """Schemas that cannot be hashed fall back to a deep comparison."""
+
+    old = _build(
+        """
+openapi: 3.0.0
+components:
+  schemas:
+    Pet:
+      default: 2020-01-01
+""",
+    )
+    new = _build(
+        """
+openapi: 3.0.0
+components:
+  schemas:
+    Pet:
+      default: 2021-01-01
+""",
+    )
+    assert "Pet" not in old.schemas_hash
+    impacts = diff_specs(old, new)
+    assert [(i.symbol, i.reason) for i in impacts] == [("Pet", "Changed schema")]
+
+
+@pytest.mark.parametrize(
+    ("old_value", "new_value"),
+    [("1", "1.0"), ("1", "true"), ("0.5", "5.0e-1")],
+)
+def test_equal_schema_values_with_different_digests_are_unchanged(old_value: str, new_value: str) -> None:
+    """Values that compare equal are not reported even if they encode differently."""
+
+    template = "openapi: 3.0.0\ncomponents:\n  schemas:\n    Pet:\n      default: {}\n"
+    old = _build(template.format(old_value))
+    new = _build(template.format(new_value))
+    assert diff_specs(old, new) == []
+
+
+def test_schema_key_types_are_not_conflated() -> None:
+    """An integer key and its string form are different schemas."""
+
+    template = "openapi: 3.0.0\ncomponents:\n  schemas:\n    Pet:\n      enum:\n        {}: a\n"
+    old = _build(template.format("1"))
+    new = _build(template.format("'1'"))
+    impacts = diff_specs(old, new)
+    assert [(i.symbol, i.reason) for i in impacts] == [("Pet", "Changed schema")]
+
+
+def test_recursive_schema_is_compared_without_digest() -> None:
+    """Self-referencing YAML anchors do not break schema digests."""
+
+    doc = "openapi: 3.0.0\ncomponents:\n  schemas:\n    Node: &node\n      items: *node\n"
+    spec = _build(doc)
+    assert "Node" not in spec.schemas_hash
+
+
+def test_schema_rename_reports_removal_and_addition() -> None:
+    """Renaming a schema is reported as a removal plus an addition."""
+
+    old = _build(
+        """
+openapi: 3.0.0
+components:
+  schemas:
+    Pet:
+      type: object
+""",
+    )
+    new = _build(
+        """
+openapi: 3.0.0
+components:
+  schemas:
+    Animal:
+      type: object
+""",
+    )
+    impacts = {(i.severity, i.symbol, i.reason) for i in diff_specs(old, new)}
+    assert impacts == {("major", "Pet", "Removed schema"), ("minor", "Animal", "Added schema")}
+
+
 def test_parameter_addition_is_minor() -> None:
     """Adding a parameter triggers a minor impact."""
 
@@ -252,3 +339,83 @@ def test_invalid_yaml_returns_empty_spec(caplog) -> None:
         spec = _parse_spec("openapi: 3.0.0: bad")
     assert spec == Spec(endpoints=set(), schemas={}, operations={})
     assert any("Failed to parse OpenAPI spec" in r.message for r in caplog.records)
+
+
+def test_non_operation_keys_are_not_endpoints() -> None:
+    """Path item metadata such as ``summary`` is not treated as an endpoint."""
+
+    spec = _build(
+        """
+openapi: 3.0.0
+paths:
+  /pets:
+    summary: Pets
+    description: Pet operations
+    servers:
+      - url: https://example.com
+    parameters: []
+    get: {}
+""",
+    )
+    assert spec.endpoints == {("/pets", "GET")}
+
+
+def test_json_spec_is_parsed() -> None:
+    """JSON documents are parsed via the JSON fast path."""
+
+    spec = _build('{"openapi": "3.0.0", "paths": {"/pets": {"get": {}}}}')
+    assert spec.endpoints == {("/pets", "GET")}
+
+
+def test_flow_style_yaml_falls_back_to_yaml() -> None:
+    """Flow-style YAML that is not valid JSON is still parsed."""
+
+    spec = _build("{openapi: 3.0.0, paths: {/pets: {get: {}}}}")
+    assert spec.endpoints == {("/pets", "GET")}
+
+
+def test_collect_reuses_parsed_spec_for_identical_content() -> None:
+    """Identical documents at different refs are parsed only once."""
+
+    doc = "openapi: 3.0.0\npaths:\n  /pets:\n    get: {}\n"
+    openapi.clear_caches()
+    with (
+        patch("bumpwright.analysers.openapi.read_files_at_ref", return_value={"openapi.yaml": doc}),
+        patch("bumpwright.analysers.openapi._parse_spec", wraps=_parse_spec) as parse,
+    ):
+        analyser = OpenAPIAnalyser(Config())
+        old = analyser.collect("base")
+        new = analyser.collect("head")
+    assert parse.call_count == 1
+    assert old == new
+    assert diff_specs(old, new) == []
+
+
+def test_spec_cache_is_bounded_and_keyed_by_digest(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The spec cache stores digests only and evicts its oldest entries."""
+
+    monkeypatch.setattr(openapi, "_SPEC_CACHE_SIZE", 2)
+    openapi.clear_caches()
+    docs = [f"openapi: 3.0.0\npaths:\n  /p{i}:\n    get: {{}}\n" for i in range(3)]
+    for doc in docs:
+        openapi._parse_spec_memoized(doc)
+    assert len(openapi._SPEC_CACHE) == openapi._SPEC_CACHE_SIZE
+    assert all(isinstance(key, bytes) for key in openapi._SPEC_CACHE)
+    with patch("bumpwright.analysers.openapi._parse_spec", wraps=_parse_spec) as parse:
+        openapi._parse_spec_memoized(docs[2])
+        openapi._parse_spec_memoized(docs[0])
+    assert parse.call_count == 1
+    openapi.clear_caches()
+
+
+def test_collect_merges_multiple_documents() -> None:
+    """Endpoints from every configured document are combined."""
+
+    docs = {
+        "openapi.yaml": "openapi: 3.0.0\npaths:\n  /pets:\n    get: {}\n",
+        "openapi.json": '{"openapi": "3.0.0", "paths": {"/owners": {"post": {}}}}',
+        "openapi.yml": None,
+    }
+    with patch("bumpwright.analysers.openapi.read_files_at_ref", return_value=docs):
+        spec = OpenAPIAnalyser(Config()).collect("HEAD")
+    assert spec.endpoints == {("/pets", "GET"), ("/owners", "POST")}
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import bumpwright.public_api
+from bumpwright import gitutils
+from bumpwright.analysers import utils
+from bumpwright.analysers.utils import clear_caches, map_sources, resolve_jobs, shutdown_executors
+from bumpwright.analysers.web_routes import _build_routes_at_ref
+from bumpwright.cli import decide
+from bumpwright.cli.decide import _build_api_at_ref
+
+
+def _init_repo(tmp_path: Path) -> Path:
+    """Create a git repository with several modules, one of them invalid."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    pkg = repo / "pkg"
+    pkg.mkdir()
+    for i in range(20):
+        (pkg / f"mod{i}.py").write_text(
+            f"""
+from flask import Flask
+
+app = Flask(__name__)
+
+@app.get("/items/{i}")
+def handler{i}(x: int, y: str = "a") -> int:
+    return x
+"""
+        )
+    (pkg / "broken.py").write_text("def oops(:\n")
+    gitutils._run(["git", "init"], str(repo))
+    gitutils._run(["git", "config", "user.email", "test@example.com"], str(repo))
+    gitutils._run(["git", "config", "user.name", "Test"], str(repo))
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "init"], str(repo))
+    return repo
+
+
+def test_resolve_jobs() -> None:
+    with patch("bumpwright.analysers.utils.os.cpu_count", return_value=8):
+        assert resolve_jobs(0) == 8  # noqa: PLR2004
+        assert resolve_jobs(3) == 3  # noqa: PLR2004
+        assert resolve_jobs(1) == 1
+    with patch("bumpwright.analysers.utils.os.cpu_count", return_value=2):
+        assert resolve_jobs(0) == 1
+        assert resolve_jobs(4) == 1
+
+
+def test_parallel_extraction_matches_serial(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Results are pickled by class reference, so undo module swaps made by
+    # other tests before sending signatures across processes.
+    monkeypatch.setitem(sys.modules, "bumpwright.public_api", bumpwright.public_api)
+    repo = _init_repo(tmp_path)
+    old_cwd = os.getcwd()
+    os.chdir(repo)
+    try:
+        clear_caches()
+        serial_api = _build_api_at_ref("HEAD", ["pkg"], [], ["_"])
+        serial_routes = _build_routes_at_ref("HEAD", ["pkg"], [])
+        decide._API_BY_BLOB.clear()
+        decide.clear_caches()
+        with patch("bumpwright.analysers.utils.os.cpu_count", return_value=4):
+            parallel_api = _build_api_at_ref("HEAD", ["pkg"], [], ["_"], jobs=2)
+            parallel_routes = _build_routes_at_ref("HEAD", ["pkg"], [], jobs=2)
+    finally:
+        os.chdir(old_cwd)
+
+    assert len(serial_api) == 20  # noqa: PLR2004
+    assert parallel_api == serial_api
+    assert parallel_routes == serial_routes
+
+
+def test_map_sources_reuses_pool_and_skips_small_batches() -> None:
+    shutdown_executors()
+    with patch("bumpwright.analysers.utils.os.cpu_count", return_value=4):
+        assert map_sources(abs, [-1, 2], jobs=2) == [1, 2]
+        assert not utils._EXECUTORS
+        items = list(range(-10, 10))
+        assert map_sources(abs, items, jobs=2) == [abs(i) for i in items]
+        pool = utils._EXECUTORS[2]
+        assert map_sources(abs, items, jobs=2) == [abs(i) for i in items]
+        assert utils._EXECUTORS == {2: pool}
+    shutdown_executors()
+    assert not utils._EXECUTORS
+
+
+def test_for_refs_collects_head_in_helper_thread(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "bumpwright.public_api", bumpwright.public_api)
+    repo = _init_repo(tmp_path)
+    (repo / "pkg" / "mod0.py").write_text("def added() -> None:\n    pass\n")
+    gitutils._run(["git", "commit", "-am", "change"], str(repo))
+    threads: dict[str, str] = {}
+
+    def build(ref: str) -> dict:
+        threads[ref] = threading.current_thread().name
+        return _build_api_at_ref(ref, ["pkg"], [], ["_"], jobs=2)
+
+    monkeypatch.chdir(repo)
+    clear_caches()
+    serial = (_build_api_at_ref("HEAD^", ["pkg"], [], ["_"]), _build_api_at_ref("HEAD", ["pkg"], [], ["_"]))
+    decide._API_BY_BLOB.clear()
+    decide.clear_caches()
+    with patch("bumpwright.analysers.utils.os.cpu_count", return_value=4):
+        assert decide._for_refs(build, "HEAD^", "HEAD", 2) == serial
+    assert threads["HEAD^"] == threading.current_thread().name
+    assert threads["HEAD"] != threads["HEAD^"]
+    assert "mod0:added" in serial[1]
+    assert "mod0:added" not in serial[0]
@@ -8,6 +8,8 @@ from unittest.mock import patch
 from bumpwright import gitutils
 from bumpwright.analysers.cli import _build_cli_at_ref
 from bumpwright.analysers.utils import clear_caches, parse_python_source
+from bumpwright.cli import decide
+from bumpwright.cli.decide import _build_api_at_ref
 
 
 def _init_repo(tmp_path: Path) -> Path:
@@ -67,3 +69,101 @@ def test_build_cli_uses_cached_ast(tmp_path: Path) -> None:
         finally:
             os.chdir(old)
         assert ap.call_count == 1  # noqa: PLR2004
+
+
+def test_build_cli_reads_files_in_one_batch(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    (repo / "pkg" / "extra.py").write_text("VALUE = 1\n")
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "extra"], str(repo))
+    clear_caches()
+    with patch(
+        "bumpwright.gitutils.BatchCatFile.read_many",
+        autospec=True,
+        side_effect=gitutils.BatchCatFile.read_many,
+    ) as read_many:
+        old = os.getcwd()
+        os.chdir(repo)
+        try:
+            _build_cli_at_ref("HEAD", ["pkg"], [])
+            _build_cli_at_ref("HEAD", ["pkg"], [])
+        finally:
+            os.chdir(old)
+        assert read_many.call_count == 1
+        assert read_many.call_args.args[1] == ["pkg/cli.py", "pkg/extra.py"]
+
+
+def test_unchanged_file_parsed_once_across_refs(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    gitutils._run(["git", "commit", "--allow-empty", "-m", "empty"], str(repo))
+    clear_caches()
+    with patch("bumpwright.analysers.utils.ast.parse", wraps=ast.parse) as ap:
+        base = parse_python_source("HEAD^", "pkg/cli.py", str(repo))
+        head = parse_python_source("HEAD", "pkg/cli.py", str(repo))
+    assert base is head
+    assert ap.call_count == 1
+
+
+def test_public_api_and_analysers_share_parsed_trees(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    clear_caches()
+    decide.clear_caches()
+    with (
+        patch("bumpwright.analysers.utils.ast.parse", wraps=ast.parse) as ap,
+        patch(
+            "bumpwright.analysers.utils.read_file_at_ref",
+            wraps=gitutils.read_file_at_ref,
+        ) as rf,
+    ):
+        old = os.getcwd()
+        os.chdir(repo)
+        try:
+            api = _build_api_at_ref("HEAD", ["pkg"], [], ["_"])
+            commands = _build_cli_at_ref("HEAD", ["pkg"], [])
+        finally:
+            os.chdir(old)
+    assert "cli:main" in api
+    assert "main" in commands
+    assert ap.call_count == 1
+    assert rf.call_count == 1
+
+
+def test_unchanged_blobs_are_not_reread_across_refs(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    (repo / "pkg" / "extra.py").write_text("def extra() -> int:\n    return 1\n")
+    gitutils._run(["git", "add", "."], str(repo))
+    gitutils._run(["git", "commit", "-m", "extra"], str(repo))
+    clear_caches()
+    old = os.getcwd()
+    os.chdir(repo)
+    try:
+        base = _build_api_at_ref("HEAD^", ["pkg"], [], ["_"])
+        with patch(
+            "bumpwright.cli.decide.iter_files_at_ref",
+            wraps=gitutils.iter_files_at_ref,
+        ) as reads:
+            head = _build_api_at_ref("HEAD", ["pkg"], [], ["_"])
+    finally:
+        os.chdir(old)
+    assert set(base) == {"cli:main"}
+    assert set(head) == {"cli:main", "extra:extra"}
+    assert list(reads.call_args.args[1]) == ["pkg/extra.py"]
+
+
+def test_build_api_at_ref_memoised_per_ref(tmp_path: Path) -> None:
+    repo = _init_repo(tmp_path)
+    decide.clear_caches()
+    old = os.getcwd()
+    os.chdir(repo)
+    try:
+        with patch(
+            "bumpwright.cli.decide.list_py_files_with_sha",
+            wraps=gitutils.list_py_files_with_sha,
+        ) as listing:
+            first = _build_api_at_ref("HEAD", ["pkg"], [], ["_"])
+            second = _build_api_at_ref("HEAD", ("pkg",), (), ("_",))
+    finally:
+        os.chdir(old)
+        decide.clear_caches()
+    assert second is first
+    assert listing.call_count == 1
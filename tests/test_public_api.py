@@ -61,6 +61,13 @@ def test_module_name_from_path_nested(tmp_path):
     assert module_name_from_path(str(root), str(path)) == "a.b.mod"
 
 
+def test_module_name_from_path_memoised():
+    module_name_from_path.cache_clear()
+    assert module_name_from_path("pkg", "pkg/a/mod.py") == "a.mod"
+    assert module_name_from_path("pkg", "pkg/a/mod.py") == "a.mod"
+    assert module_name_from_path.cache_info().hits == 1
+
+
 def test_module_name_from_path_outside_root(tmp_path):
     root = tmp_path / "pkg"
     path = tmp_path / "other" / "mod.py"
@@ -100,6 +107,35 @@ def _bar():
     assert "pkg.mod:_bar" not in api
 
 
+def test_extract_searches_compound_statements_only() -> None:
+    """Collect definitions inside module-level blocks but not function bodies."""
+
+    code = """
+try:
+    def fast(): pass
+except ImportError:
+    def slow(): pass
+if True:
+    class Guarded:
+        def ping(self): pass
+        class Inner:
+            def skip(self): pass
+def outer():
+    def inner(): pass
+match 1:
+    case 1:
+        def matched(): pass
+"""
+    api = extract_public_api_from_source("pkg.mod", code)
+    assert list(api) == [
+        "pkg.mod:fast",
+        "pkg.mod:slow",
+        "pkg.mod:Guarded.ping",
+        "pkg.mod:outer",
+        "pkg.mod:matched",
+    ]
+
+
 def test_extract_invalid_code_raises() -> None:
     """Raise ``SyntaxError`` when source cannot be parsed."""
 
@@ -107,6 +143,59 @@ def test_extract_invalid_code_raises() -> None:
         extract_public_api_from_source("pkg.mod", "def bad(:\n pass")
 
 
+def test_extract_skips_sources_without_definitions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Return nothing without parsing sources that cannot define symbols."""
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("source should not be parsed")
+
+    monkeypatch.setattr(public_api.ast, "parse", fail)
+    assert extract_public_api_from_source("pkg.mod", "VALUE = 1\n__all__ = ['VALUE']\n") == {}
+
+
+def test_identical_params_are_shared() -> None:
+    """Equal parameters across functions reuse one ``Param`` instance."""
+
+    code = """
+class A:
+    def f(self, x: int = 0):
+        pass
+class B:
+    def g(self, x: int = 0):
+        pass
+"""
+    api = extract_public_api_from_source("pkg.mod", code)
+    first = api["pkg.mod:A.f"].params
+    second = api["pkg.mod:B.g"].params
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+@pytest.mark.parametrize(
+    "expr",
+    [
+        "int",
+        "typing.Optional",
+        "a.b.c",
+        "None",
+        "True",
+        "42",
+        "'text'",
+        "'it\\'s'",
+        "'tab\\t'",
+        "u'legacy'",
+        "1.5",
+        "-1",
+        "f().attr",
+        "list[int] | None",
+    ],
+)
+def test_render_node_matches_unparse(expr: str) -> None:
+    """Fast rendering paths agree exactly with ``ast.unparse``."""
+
+    node = public_api.ast.parse(expr, mode="eval").body
+    assert public_api.render_node(node) == public_api.ast.unparse(node)
+
+
 @pytest.mark.parametrize(
     "prefix",
     [
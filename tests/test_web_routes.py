@@ -101,6 +101,33 @@ async def a():
     assert ("/a", "GET") in routes
 
 
+def test_async_route_param_changes_detected() -> None:
+    """Parameter changes on async handlers are reported like sync ones."""
+
+    old = _build(
+        """
+from fastapi import FastAPI
+app = FastAPI()
+
+@app.get('/a')
+async def a(q: str = ''):
+    return 1
+"""
+    )
+    new = _build(
+        """
+from fastapi import FastAPI
+app = FastAPI()
+
+@app.get('/a')
+async def a(q: str):
+    return 1
+"""
+    )
+    impacts = diff_routes(old, new)
+    assert [(i.severity, i.reason) for i in impacts] == [("major", "Param 'q' became required")]
+
+
 def test_flask_multiple_methods_extracted() -> None:
     """Flask routes with multiple methods should produce entries per method."""
 
@@ -116,3 +143,92 @@ def a():
     )
     assert ("/a", "POST") in routes
     assert ("/a", "PUT") in routes
+
+
+def test_nested_routes_are_detected() -> None:
+    """Routes inside app factories, conditionals, and classes are found."""
+
+    routes = _build(
+        """
+from flask import Flask
+
+def create_app():
+    app = Flask(__name__)
+
+    @app.route('/factory')
+    def factory():
+        return 'ok'
+
+    return app
+
+if True:
+    @app.post('/conditional')
+    def conditional():
+        return 'ok'
+
+class Views:
+    @app.get('/method')
+    def method(self):
+        return 'ok'
+"""
+    )
+    assert set(routes) == {("/factory", "GET"), ("/conditional", "POST"), ("/method", "GET")}
+
+
+def test_route_changes_added_removed_and_unchanged() -> None:
+    """Report added and removed routes while skipping unchanged handlers."""
+
+    old = {
+        ("/a", "GET"): Route("/a", "GET", {"x": True}),
+        ("/b", "GET"): Route("/b", "GET", {"y": False}),
+    }
+    new = {
+        ("/a", "GET"): Route("/a", "GET", {"x": True}),
+        ("/c", "POST"): Route("/c", "POST", {}),
+    }
+    impacts = diff_routes(old, new)
+    assert sorted((i.severity, i.symbol, i.reason) for i in impacts) == [
+        ("major", "GET /b", "Removed route"),
+        ("minor", "POST /c", "Added route"),
+    ]
+
+
+def test_route_strings_are_interned() -> None:
+    """Routes parsed from separate sources share path and method strings."""
+
+    src = """
+from flask import Flask
+app = Flask(__name__)
+
+@app.route('/items/x', methods=['post'])
+def create(item_id):
+    return 'ok'
+"""
+    (route,) = _build(src).values()
+    (other,) = _build(src.replace("create", "create2")).values()
+    assert route.path is other.path
+    assert route.method is other.method
+
+
+def test_decorator_names_are_case_insensitive() -> None:
+    """Route decorators are recognised regardless of attribute casing."""
+
+    routes = _build(
+        """
+from fastapi import FastAPI
+app = FastAPI()
+
+@app.Get('/a')
+def a(q: int):
+    return q
+
+@app.ROUTE('/b')
+def b():
+    return 'ok'
+
+@app.cache()
+def c():
+    return 'ok'
+"""
+    )
+    assert set(routes) == {("/a", "GET"), ("/b", "GET")}